@@ -24,23 +24,94 @@ MEJORAS IMPLEMENTADAS (RECOMENDACIONES CICLO 7):
 ✅ Tests de casos de fallo y edge cases
 ✅ Métricas de performance para fallback
 ✅ Cobertura de edge cases y interacción entre servicios
+
+EJECUCIÓN EN PARALELO:
+Cada clase está marcada con ``xdist_group`` según el servicio que prueba,
+así cada worker importa un único módulo de servicio:
+
+    pytest -n auto --dist=loadgroup tests/unit/test_tdd_services_cycle7.py
 """
 
-from unittest.mock import patch
+import functools
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-
-@pytest.fixture(autouse=True)
+# Si los servicios no son importables se salta el módulo completo una sola
+# vez durante la colección, en lugar de un try/except ImportError por test.
+ServiceObserver = pytest.importorskip("app.services.base_service").ServiceObserver
+ConcreteBaseService = pytest.importorskip(
+    "app.services.concrete_base_service"
+).ConcreteBaseService
+PredictionService = pytest.importorskip(
+    "app.services.prediction_service"
+).PredictionService
+HybridPredictionService = pytest.importorskip(
+    "app.services.hybrid_prediction_service"
+).HybridPredictionService
+ModelManagementService = pytest.importorskip(
+    "app.services.model_management_service"
+).ModelManagementService
+PredictionRequest = pytest.importorskip("app.models.api_models").PredictionRequest
+_exceptions = pytest.importorskip("app.utils.exceptions")
+DataValidationError = _exceptions.DataValidationError
+PredictionError = _exceptions.PredictionError
+
+# Mocks de modelo compartidos: se crean una vez por módulo, no por test
+_SHARED_MODEL_MOCK = MagicMock()
+_SHARED_MODELS = {"test_model": _SHARED_MODEL_MOCK}
+
+
+@pytest.fixture(autouse=True, scope="session")
 def setup_test_env():
-    """Setup para tests TDD CYCLE 7."""
-    # Configurar entorno de prueba
-    import os
-
+    """Setup para tests TDD CYCLE 7 (una vez por sesión/worker)."""
+    # Configurar entorno de prueba y restaurar el valor previo al final
+    previous = os.environ.get("TESTING")
     os.environ["TESTING"] = "true"
     yield
+    if previous is None:
+        os.environ.pop("TESTING", None)
+    else:
+        os.environ["TESTING"] = previous
+
+
+@pytest.fixture
+def failing_mock():
+    """Fábrica de mocks que lanzan la excepción indicada al ser llamados.
+
+    Cada llamada crea un MagicMock nuevo (sin estado compartido entre tests);
+    el reemplazo se aplica con ``monkeypatch``, que lo deshace al terminar.
+    """
+
+    def _make(error):
+        return MagicMock(side_effect=error)
+
+    return _make
 
 
+def _missing_attrs(obj, expected):
+    """Devolver los atributos de ``expected`` ausentes en ``obj``.
+
+    Un único ``dir()`` sustituye a una cadena de ``hasattr`` y permite
+    reportar todos los atributos que faltan a la vez.
+    """
+    return sorted(set(expected) - set(dir(obj)))
+
+
+@functools.lru_cache(maxsize=32)
+def _make_request(features_items, model_id="default_model"):
+    """Construir un PredictionRequest validado una sola vez por combinación.
+
+    Los tests solo leen la request, por lo que compartir la instancia es
+    seguro. ``features_items`` es una tupla de pares (clave, valor).
+    """
+    return PredictionRequest(features=dict(features_items), model_id=model_id)
+
+
+@pytest.mark.xdist_group(name="baseservice")
 class TestBaseServiceTDDCycle7:
     """
     TDD CYCLE 7 - BaseService Tests
@@ -53,27 +124,20 @@ class TestBaseServiceTDDCycle7:
         GREEN PHASE: Mejorar BaseService con atributos necesarios.
         """
         try:
-            from app.services.concrete_base_service import ConcreteBaseService
-
             # GREEN: Ahora debe pasar - BaseService mejorado
             service = ConcreteBaseService()
 
             # Tests que deben pasar en GREEN PHASE
-            assert hasattr(service, "config"), "BaseService debe tener config"
-            assert hasattr(
-                service, "error_handler"
-            ), "BaseService debe tener error_handler"
-            assert hasattr(
-                service, "is_initialized"
-            ), "BaseService debe tener is_initialized"
+            missing = _missing_attrs(
+                service, ("config", "error_handler", "is_initialized")
+            )
+            assert not missing, f"BaseService debe tener: {missing}"
 
             # Validar inicialización
             assert service.is_initialized is True, "Servicio debe estar inicializado"
             assert service.config is not None, "Config no debe ser None"
             assert service.error_handler is not None, "Error handler no debe ser None"
 
-        except ImportError:
-            pytest.skip("BaseService no disponible")
         except (AttributeError, AssertionError) as e:
             # RED PHASE: Se espera que falle
             pytest.fail(f"RED PHASE - Expected failure: {e}")
@@ -84,8 +148,6 @@ class TestBaseServiceTDDCycle7:
         GREEN PHASE: Implementar validate_input robusto.
         """
         try:
-            from app.services.concrete_base_service import ConcreteBaseService
-
             service = ConcreteBaseService()
 
             # RED: Debe fallar - método validate_input necesita mejoras
@@ -93,15 +155,14 @@ class TestBaseServiceTDDCycle7:
                 service, "validate_input"
             ), "Debe tener método validate_input"
 
-            # Tests de validación
-            assert (
-                service.validate_input({"valid": "data"}) is True
-            ), "Datos válidos deben pasar"
-            assert service.validate_input(None) is False, "None debe fallar"
-            assert service.validate_input({}) is False, "Dict vacío debe fallar"
+            # Tests de validación (bucle simple en lugar de parametrize)
+            for payload, expected, message in (
+                ({"valid": "data"}, True, "Datos válidos deben pasar"),
+                (None, False, "None debe fallar"),
+                ({}, False, "Dict vacío debe fallar"),
+            ):
+                assert service.validate_input(payload) is expected, message
 
-        except ImportError:
-            pytest.skip("BaseService no disponible")
         except (AttributeError, AssertionError) as e:
             # RED PHASE: Se espera que falle
             pytest.fail(f"RED PHASE - Expected failure: {e}")
@@ -112,15 +173,11 @@ class TestBaseServiceTDDCycle7:
         GREEN PHASE: Implementar error handling robusto.
         """
         try:
-            from app.services.concrete_base_service import ConcreteBaseService
-
             service = ConcreteBaseService()
 
             # RED: Debe fallar - error handling necesita mejoras
-            assert hasattr(service, "handle_error"), "Debe tener método handle_error"
-            assert hasattr(
-                service, "last_error_context"
-            ), "Debe tener last_error_context"
+            missing = _missing_attrs(service, ("handle_error", "last_error_context"))
+            assert not missing, f"Faltan atributos de error handling: {missing}"
 
             # Test error handling
             test_error = Exception("Test error")
@@ -136,151 +193,123 @@ class TestBaseServiceTDDCycle7:
                 service.last_error_context["operation"] == "test"
             ), "Debe preservar contexto"
 
-        except ImportError:
-            pytest.skip("BaseService no disponible")
         except (AttributeError, AssertionError) as e:
             # RED PHASE: Se espera que falle
             pytest.fail(f"RED PHASE - Expected failure: {e}")
 
 
+@pytest.mark.xdist_group(name="baseservice")
 class TestBaseServiceFailureCases:
     """
     MEJORA 3: Tests de casos de fallo y edge cases para BaseService
     """
 
-    def test_base_service_initialization_failure(self):
+    def test_base_service_initialization_failure(self, monkeypatch, failing_mock):
         """Test fallo en inicialización del servicio."""
-        try:
-            from app.services.concrete_base_service import ConcreteBaseService
-
-            # Simular fallo en inicialización
-            with patch.object(
-                ConcreteBaseService, "initialize", side_effect=Exception("Init failed")
-            ):
-                service = ConcreteBaseService()
-
-                # El servicio debe manejar el fallo gracefully
-                assert (
-                    service.is_initialized is False
-                ), "Servicio no debe estar inicializado tras fallo"
-
-        except ImportError:
-            pytest.skip("ConcreteBaseService no disponible")
+        # Simular fallo en inicialización
+        monkeypatch.setattr(
+            ConcreteBaseService,
+            "initialize",
+            failing_mock(Exception("Init failed")),
+        )
+        service = ConcreteBaseService()
+
+        # El servicio debe manejar el fallo gracefully
+        assert (
+            service.is_initialized is False
+        ), "Servicio no debe estar inicializado tras fallo"
 
     def test_base_service_observer_notification_failure(self):
         """Test fallo en notificación a observers."""
-        try:
-            from app.services.base_service import ServiceObserver
-            from app.services.concrete_base_service import ConcreteBaseService
-
-            service = ConcreteBaseService()
-
-            # Observer que falla
-            class FailingObserver(ServiceObserver):
-                def on_service_event(self, event_type, service_name, details):
-                    raise Exception("Observer failed")
+        service = ConcreteBaseService()
 
-            failing_observer = FailingObserver()
-            service.add_observer(failing_observer)
+        # Observer que falla
+        class FailingObserver(ServiceObserver):
+            def on_service_event(self, event_type, service_name, details):
+                raise Exception("Observer failed")
 
-            # La notificación debe manejar el fallo sin interrumpir
-            service.notify_observers("test_event", {"data": "test"})
+        failing_observer = FailingObserver()
+        service.add_observer(failing_observer)
 
-            # El servicio debe seguir funcionando
-            assert service.is_initialized is True
+        # La notificación debe manejar el fallo sin interrumpir
+        service.notify_observers("test_event", {"data": "test"})
 
-        except ImportError:
-            pytest.skip("BaseService components no disponibles")
+        # El servicio debe seguir funcionando
+        assert service.is_initialized is True
 
     def test_base_service_context_manager_exception_handling(self):
         """Test manejo de excepciones en context manager."""
-        try:
-            from app.services.concrete_base_service import ConcreteBaseService
-
-            service = ConcreteBaseService()
+        service = ConcreteBaseService()
 
-            # Test que la excepción se propaga correctamente
-            with pytest.raises(ValueError, match="Test exception"):
-                with service.service_context("test_operation"):
-                    raise ValueError("Test exception")
+        # Test que la excepción se propaga correctamente
+        with pytest.raises(ValueError, match="Test exception"):
+            with service.service_context("test_operation"):
+                raise ValueError("Test exception")
 
-            # Verificar que el error fue registrado
-            assert service.last_error_context is not None
-
-        except ImportError:
-            pytest.skip("ConcreteBaseService no disponible")
+        # Verificar que el error fue registrado
+        assert service.last_error_context is not None
 
     def test_base_service_invalid_strategy_execution(self):
         """Test ejecución de estrategia inválida."""
-        try:
-            from app.services.concrete_base_service import ConcreteBaseService
+        service = ConcreteBaseService()
 
-            service = ConcreteBaseService()
-
-            # Intentar ejecutar estrategia inexistente
-            result = service.execute_strategy("nonexistent_strategy", "data")
+        # Intentar ejecutar estrategia inexistente
+        result = service.execute_strategy("nonexistent_strategy", "data")
 
-            assert result.success is False
-            assert result.error and "not found" in result.error.lower()
-            assert "available_strategies" in result.details
-
-        except ImportError:
-            pytest.skip("ConcreteBaseService no disponible")
+        assert result.success is False
+        assert result.error and "not found" in result.error.lower()
+        assert "available_strategies" in result.details
 
     def test_base_service_edge_cases_validation(self):
         """Test casos edge en validación de entrada."""
-        try:
-            from app.services.concrete_base_service import ConcreteBaseService
+        service = ConcreteBaseService()
 
-            service = ConcreteBaseService()
-
-            # Casos edge
-            edge_cases = [
-                ([], False),  # Lista vacía
-                ("", False),  # String vacío
-                (0, True),  # Cero es válido
-                (False, True),  # False es válido
-                (float("nan"), True),  # NaN es técnicamente válido
-                ({"nested": {"empty": {}}}, True),  # Dict anidado con vacío
-            ]
-
-            for case, expected in edge_cases:
-                result = service.validate_input(case)
-                assert result == expected, f"Caso {case} debería ser {expected}"
+        # Casos edge
+        edge_cases = [
+            ([], False),  # Lista vacía
+            ("", False),  # String vacío
+            (0, True),  # Cero es válido
+            (False, True),  # False es válido
+            (float("nan"), True),  # NaN es técnicamente válido
+            ({"nested": {"empty": {}}}, True),  # Dict anidado con vacío
+        ]
 
-        except ImportError:
-            pytest.skip("ConcreteBaseService no disponible")
+        for case, expected in edge_cases:
+            result = service.validate_input(case)
+            assert result == expected, f"Caso {case} debería ser {expected}"
 
 
+@pytest.mark.xdist_group(name="predictionservice")
 class TestPredictionServiceTDDCycle7:
     """
     TDD CYCLE 7 - PredictionService Tests
     RED PHASE: Tests que deben FALLAR inicialmente
     """
 
+    @classmethod
+    def setup_class(cls):
+        """Construir el servicio una sola vez para toda la clase."""
+        cls.service = PredictionService()
+
     def test_prediction_service_initialization_red_phase(self):
         """
         RED PHASE: Test de inicialización que debe fallar.
         GREEN PHASE: Mejorar PredictionService con componentes necesarios.
         """
         try:
-            from app.services.prediction_service import PredictionService
-
             # RED: Debe fallar - PredictionService necesita mejoras
-            service = PredictionService()
+            service = self.service
 
             # Tests que deben pasar en GREEN PHASE
-            assert hasattr(service, "model_manager"), "Debe tener model_manager"
-            assert hasattr(service, "validator"), "Debe tener validator"
-            assert hasattr(service, "preprocessor"), "Debe tener preprocessor"
-            assert hasattr(service, "postprocessor"), "Debe tener postprocessor"
+            missing = _missing_attrs(
+                service, ("model_manager", "validator", "preprocessor", "postprocessor")
+            )
+            assert not missing, f"PredictionService debe tener: {missing}"
 
             # Validar estado inicial
             assert service.is_ready is True, "Servicio debe estar listo"
             assert service.model_loaded is not None, "model_loaded debe estar definido"
 
-        except ImportError:
-            pytest.skip("PredictionService no disponible")
         except (AttributeError, AssertionError) as e:
             # RED PHASE: Se espera que falle
             pytest.fail(f"RED PHASE - Expected failure: {e}")
@@ -291,9 +320,7 @@ class TestPredictionServiceTDDCycle7:
         GREEN PHASE: Implementar load_model robusto.
         """
         try:
-            from app.services.prediction_service import PredictionService
-
-            service = PredictionService()
+            service = self.service
 
             # RED: Debe fallar - load_model necesita mejoras
             result = service.load_model("test_model_path")
@@ -307,8 +334,6 @@ class TestPredictionServiceTDDCycle7:
             result = service.load_model("invalid_path")
             assert result is False, "load_model debe retornar False para path inválido"
 
-        except ImportError:
-            pytest.skip("PredictionService no disponible")
         except (AttributeError, AssertionError) as e:
             # RED PHASE: Se espera que falle
             pytest.fail(f"RED PHASE - Expected failure: {e}")
@@ -320,40 +345,42 @@ class TestPredictionServiceTDDCycle7:
         GREEN PHASE: Implementar predict robusto.
         """
         try:
-            from app.models.api_models import PredictionRequest
-            from app.services.prediction_service import PredictionService
-
-            service = PredictionService()
+            service = self.service
 
             # RED: Debe fallar - predict necesita mejoras
             # Usar datos válidos según el esquema requerido
-            request = PredictionRequest(
-                features={
-                    "age": 30.0,
-                    "income": 50000.0,
-                    "category": "premium",
-                    "score": 0.85,
-                },
-                model_id="test_model"
+            request = _make_request(
+                (
+                    ("age", 30.0),
+                    ("income", 50000.0),
+                    ("category", "premium"),
+                    ("score", 0.85),
+                ),
+                model_id="test_model",
             )
 
-            # El servicio puede fallar por modelo no encontrado, pero debe
-            # manejar el error
+            # Un único patcher con mocks pre-construidos simula el modelo
+            # cargado; si aun así falla, debe ser un error del modelo
             try:
-                result = await service.predict(request)
+                with patch.multiple(
+                    service,
+                    model_loaded=True,
+                    current_model=_SHARED_MODEL_MOCK,
+                    models=_SHARED_MODELS,
+                ):
+                    result = await service.predict(request)
                 assert result is not None, "predict debe retornar resultado"
                 assert hasattr(result, "prediction"), "Resultado debe tener prediction"
             except Exception as e:
                 # Es aceptable que falle si el modelo no existe
                 assert "modelo" in str(e).lower() or "model" in str(e).lower()
 
-        except ImportError:
-            pytest.skip("PredictionService components no disponibles")
         except (AttributeError, AssertionError) as e:
             # RED PHASE: Se espera que falle
             pytest.fail(f"RED PHASE - Expected failure: {e}")
 
 
+@pytest.mark.xdist_group(name="predictionservice")
 class TestPredictionServiceFailureCases:
     """
     MEJORA 3: Tests de casos de fallo para PredictionService
@@ -362,132 +389,110 @@ class TestPredictionServiceFailureCases:
     @pytest.mark.asyncio
     async def test_prediction_service_model_not_found_error(self):
         """Test error cuando modelo no existe."""
-        try:
-            from app.models.api_models import PredictionRequest
-            from app.services.prediction_service import PredictionService
-            from app.utils.exceptions import PredictionError
-
-            service = PredictionService()
-
-            # Solicitar modelo inexistente con datos válidos
-            request = PredictionRequest(
-                features={
-                    "age": 25.0,
-                    "income": 40000.0,
-                    "category": "standard",
-                    "score": 0.75,
-                },
-                model_id="nonexistent_model"
-            )
-
-            with pytest.raises(PredictionError) as exc_info:
-                await service.predict(request)
-
-            error_message = str(exc_info.value)
-            assert error_message and "no encontrado" in error_message.lower()
-            assert "fallback" in str(exc_info.value).lower()
-
-        except ImportError:
-            pytest.skip("PredictionService components no disponibles")
+        service = PredictionService()
+
+        # Solicitar modelo inexistente con datos válidos
+        request = _make_request(
+            (
+                ("age", 25.0),
+                ("income", 40000.0),
+                ("category", "standard"),
+                ("score", 0.75),
+            ),
+            model_id="nonexistent_model",
+        )
+
+        with pytest.raises(PredictionError) as exc_info:
+            await service.predict(request)
+
+        error_message = str(exc_info.value)
+        assert error_message and "no encontrado" in error_message.lower()
+        assert "fallback" in str(exc_info.value).lower()
 
     @pytest.mark.asyncio
     async def test_prediction_service_invalid_input_data(self):
         """Test predicción con datos inválidos."""
-        try:
-            from app.models.api_models import PredictionRequest
-            from app.services.prediction_service import PredictionService
-            from app.utils.exceptions import DataValidationError
-
-            service = PredictionService()
-
-            # Datos inválidos - campo score como string en lugar de número
-            invalid_data = PredictionRequest(
-                features={
-                    "age": 30.0,
-                    "income": 50000.0,
-                    "category": "premium",
-                    "score": "not_a_number",  # Este campo debe ser numérico
-                },
-                model_id="test_model"
-            )
-
-            with pytest.raises(DataValidationError) as exc_info:
-                await service.predict(invalid_data)
-
-            assert (
-                "inválidos" in str(exc_info.value).lower()
-            ), "El error debe indicar datos inválidos"
-        except ImportError:
-            pytest.skip("PredictionService o DataValidationError no disponibles")
+        service = PredictionService()
+
+        # Datos inválidos - campo score como string en lugar de número
+        invalid_data = _make_request(
+            (
+                ("age", 30.0),
+                ("income", 50000.0),
+                ("category", "premium"),
+                ("score", "not_a_number"),  # Este campo debe ser numérico
+            ),
+            model_id="test_model",
+        )
+
+        with pytest.raises(DataValidationError) as exc_info:
+            await service.predict(invalid_data)
+
+        assert (
+            "inválidos" in str(exc_info.value).lower()
+        ), "El error debe indicar datos inválidos"
 
     def test_prediction_service_model_loading_failure(self):
         """Test fallo en carga de modelos."""
-        try:
-            from app.services.prediction_service import PredictionService
-
-            # Simular fallo en carga de modelos
-            with patch("pathlib.Path.exists", return_value=False):
-                service = PredictionService()
-
-                # El servicio debe manejar gracefully la ausencia de modelos
-                assert service.is_ready is False or len(service.models) == 0
+        # Simular fallo en carga de modelos
+        with patch("pathlib.Path.exists", return_value=False):
+            service = PredictionService()
 
-        except ImportError:
-            pytest.skip("PredictionService no disponible")
+            # El servicio debe manejar gracefully la ausencia de modelos
+            assert service.is_ready is False or len(service.models) == 0
 
     @pytest.mark.asyncio
-    async def test_prediction_service_preprocessing_failure(self):
+    async def test_prediction_service_preprocessing_failure(
+        self, monkeypatch, failing_mock
+    ):
         """Test fallo en preprocessing de datos."""
-        try:
-            from app.services.prediction_service import PredictionService
+        service = PredictionService()
 
-            service = PredictionService()
-
-            # Simular fallo en preprocessing
-            with patch.object(
-                service,
-                "_preprocess_data",
-                side_effect=Exception("Preprocessing failed"),
-            ):
-                # Mock de datos que causarían fallo
-                malformed_data = {"feature1": float("inf"), "feature2": None}
+        # Simular fallo en preprocessing
+        monkeypatch.setattr(
+            service,
+            "_preprocess_data",
+            failing_mock(Exception("Preprocessing failed")),
+        )
+        # Mock de datos que causarían fallo
+        malformed_data = {"feature1": float("inf"), "feature2": None}
 
-                with pytest.raises(Exception, match="Preprocessing failed"):
-                    await service._preprocess_data(malformed_data, "test_model")
-
-        except ImportError:
-            pytest.skip("PredictionService no disponible")
+        with pytest.raises(Exception, match="Preprocessing failed"):
+            await service._preprocess_data(malformed_data, "test_model")
 
 
+@pytest.mark.xdist_group(name="hybridservice")
 class TestHybridPredictionServiceTDDCycle7:
     """
     TDD CYCLE 7 - HybridPredictionService Tests
     RED PHASE: Tests que deben FALLAR inicialmente
     """
 
+    @classmethod
+    def setup_class(cls):
+        """Construir el servicio una sola vez para toda la clase."""
+        cls.service = HybridPredictionService()
+
     def test_hybrid_service_initialization_red_phase(self):
         """
         RED PHASE: Test de inicialización que debe fallar.
         GREEN PHASE: Mejorar HybridPredictionService con fallback.
         """
         try:
-            from app.services.hybrid_prediction_service import HybridPredictionService
-
             # RED: Debe fallar - HybridService necesita mejoras
-            service = HybridPredictionService()
+            service = self.service
 
             # Tests que deben pasar en GREEN PHASE
-            assert hasattr(service, "primary_service"), "Debe tener servicio primario"
-            assert hasattr(service, "fallback_service"), "Debe tener servicio fallback"
-            assert hasattr(service, "fallback_enabled"), "Debe tener fallback_enabled"
+            missing = _missing_attrs(
+                service, ("primary_service", "fallback_service", "fallback_enabled")
+            )
+            assert not missing, f"HybridPredictionService debe tener: {missing}"
 
             # Validar configuración inicial
             assert (
                 service.fallback_enabled is True
             ), "Fallback debe estar habilitado por defecto"
 
-        except ImportError:
-            pytest.skip("HybridPredictionService no disponible")
         except (AttributeError, AssertionError) as e:
             # RED PHASE: Se espera que falle
             pytest.fail(f"RED PHASE - Expected failure: {e}")
@@ -498,17 +503,13 @@ class TestHybridPredictionServiceTDDCycle7:
         GREEN PHASE: Implementar fallback robusto.
         """
         try:
-            from app.services.hybrid_prediction_service import HybridPredictionService
-
-            service = HybridPredictionService()
+            service = self.service
 
             # RED: Debe fallar - fallback mechanism necesita mejoras
-            assert hasattr(
-                service, "fallback_count"
-            ), "Debe tener contador de fallbacks"
-            assert hasattr(
-                service, "last_fallback_reason"
-            ), "Debe tener razón del último fallback"
+            missing = _missing_attrs(
+                service, ("fallback_count", "last_fallback_reason")
+            )
+            assert not missing, f"Faltan atributos de fallback: {missing}"
 
             # Simular fallo del servicio primario
             service.fallback_count = 0
@@ -520,96 +521,82 @@ class TestHybridPredictionServiceTDDCycle7:
                 service.last_fallback_reason is not None
             ), "Debe registrar razón del fallback"
 
-        except ImportError:
-            pytest.skip("HybridPredictionService no disponible")
         except (AttributeError, AssertionError) as e:
             # RED PHASE: Se espera que falle
             pytest.fail(f"RED PHASE - Expected failure: {e}")
 
 
+@pytest.mark.xdist_group(name="hybridservice")
 class TestHybridPredictionServiceFailureCases:
     """
     MEJORA 3: Tests de casos de fallo para HybridPredictionService
     """
 
     @pytest.mark.asyncio
-    async def test_hybrid_service_primary_and_fallback_failure(self):
+    async def test_hybrid_service_primary_and_fallback_failure(
+        self, monkeypatch, failing_mock
+    ):
         """Test cuando tanto servicio primario como fallback fallan."""
-        try:
-            from app.services.hybrid_prediction_service import HybridPredictionService
-
-            service = HybridPredictionService()
-
-            # Simular fallo en ambos servicios
-            with patch.object(
-                service,
-                "_predict_with_primary",
-                side_effect=Exception("Primary failed"),
-            ):
-                with patch.object(
-                    service,
-                    "_predict_with_fallback",
-                    side_effect=Exception("Fallback failed"),
-                ):
-                    test_data = {"feature1": 1.0, "feature2": 2.0}
-
-                    with pytest.raises(Exception):
-                        await service.predict_hybrid(test_data)
-
-        except ImportError:
-            pytest.skip("HybridPredictionService no disponible")
+        service = HybridPredictionService()
+
+        # Simular fallo en ambos servicios
+        monkeypatch.setattr(
+            service,
+            "_predict_with_primary",
+            failing_mock(Exception("Primary failed")),
+        )
+        monkeypatch.setattr(
+            service,
+            "_predict_with_fallback",
+            failing_mock(Exception("Fallback failed")),
+        )
+        test_data = {"feature1": 1.0, "feature2": 2.0}
+
+        with pytest.raises(Exception):
+            await service.predict_hybrid(test_data)
 
     @pytest.mark.asyncio
-    async def test_hybrid_service_fallback_disabled_scenario(self):
+    async def test_hybrid_service_fallback_disabled_scenario(
+        self, monkeypatch, failing_mock
+    ):
         """Test comportamiento cuando fallback está deshabilitado."""
-        try:
-            from app.services.hybrid_prediction_service import HybridPredictionService
-
-            service = HybridPredictionService()
-            service.fallback_enabled = False
+        service = HybridPredictionService()
+        service.fallback_enabled = False
 
-            # Cuando fallback está deshabilitado, solo debe usar servicio primario
-            assert service.fallback_enabled is False
+        # Cuando fallback está deshabilitado, solo debe usar servicio primario
+        assert service.fallback_enabled is False
 
-            # Simular fallo del primario sin fallback disponible
-            with patch.object(
-                service,
-                "_predict_with_primary",
-                side_effect=Exception("Primary failed"),
-            ):
-                test_data = {"feature1": 1.0}
-
-                with pytest.raises(Exception, match="Primary failed"):
-                    await service._predict_with_primary(test_data)
+        # Simular fallo del primario sin fallback disponible
+        monkeypatch.setattr(
+            service,
+            "_predict_with_primary",
+            failing_mock(Exception("Primary failed")),
+        )
+        test_data = {"feature1": 1.0}
 
-        except ImportError:
-            pytest.skip("HybridPredictionService no disponible")
+        with pytest.raises(Exception, match="Primary failed"):
+            await service._predict_with_primary(test_data)
 
     def test_hybrid_service_performance_metrics_on_failure(self):
         """Test métricas de performance durante fallos."""
-        try:
-            from app.services.hybrid_prediction_service import HybridPredictionService
-
-            service = HybridPredictionService()
-
-            # Verificar que métricas se actualizan en fallos
-            initial_fallback_count = getattr(service, "fallback_count", 0)
+        service = HybridPredictionService()
 
-            # Simular fallo y fallback
-            service._handle_primary_failure("Test failure for metrics")
+        # Verificar que métricas se actualizan en fallos
+        initial_fallback_count = getattr(service, "fallback_count", 0)
 
-            # Verificar actualización de métricas
-            assert hasattr(service, "fallback_count")
-            assert service.fallback_count > initial_fallback_count
+        # Simular fallo y fallback
+        service._handle_primary_failure("Test failure for metrics")
 
-            # Verificar métricas de tiempo si existen
-            if hasattr(service, "fallback_times"):
-                assert isinstance(service.fallback_times, list)
+        # Verificar actualización de métricas
+        assert hasattr(service, "fallback_count")
+        assert service.fallback_count > initial_fallback_count
 
-        except ImportError:
-            pytest.skip("HybridPredictionService no disponible")
+        # Verificar métricas de tiempo si existen
+        if hasattr(service, "fallback_times"):
+            assert isinstance(service.fallback_times, list)
 
 
+@pytest.mark.xdist_group(name="modelmanagement")
 class TestModelManagementServiceTDDCycle7:
     """
     TDD CYCLE 7 - ModelManagementService Tests
@@ -622,15 +609,14 @@ class TestModelManagementServiceTDDCycle7:
         GREEN PHASE: Mejorar ModelManagementService con registry.
         """
         try:
-            from app.services.model_management_service import ModelManagementService
-
             # RED: Debe fallar - ModelManagementService necesita mejoras
             service = ModelManagementService()
 
             # Tests que deben pasar en GREEN PHASE
-            assert hasattr(service, "model_registry"), "Debe tener model_registry"
-            assert hasattr(service, "version_control"), "Debe tener version_control"
-            assert hasattr(service, "model_cache"), "Debe tener model_cache"
+            missing = _missing_attrs(
+                service, ("model_registry", "version_control", "model_cache")
+            )
+            assert not missing, f"ModelManagementService debe tener: {missing}"
 
             # Validar inicialización
             assert service.model_registry is not None, "Registry no debe ser None"
@@ -638,8 +624,6 @@ class TestModelManagementServiceTDDCycle7:
                 service.version_control is not None
             ), "Version control no debe ser None"
 
-        except ImportError:
-            pytest.skip("ModelManagementService no disponible")
         except (AttributeError, AssertionError) as e:
             # RED PHASE: Se espera que falle
             pytest.fail(f"RED PHASE - Expected failure: {e}")
@@ -650,16 +634,13 @@ class TestModelManagementServiceTDDCycle7:
         GREEN PHASE: Implementar version control robusto.
         """
         try:
-            from app.services.model_management_service import ModelManagementService
-
             service = ModelManagementService()
 
             # Verificar que el servicio tiene los métodos necesarios
-            assert hasattr(service, "register_model"), "Debe tener register_model"
-            assert hasattr(service, "get_model_version"), "Debe tener get_model_version"
-            assert hasattr(
-                service, "update_model_version"
-            ), "Debe tener update_model_version"
+            missing = _missing_attrs(
+                service, ("register_model", "get_model_version", "update_model_version")
+            )
+            assert not missing, f"Faltan métodos de versionado: {missing}"
 
             # Test registro de modelo con versión
             result = service.register_model("test_model", "1.0.0")
@@ -680,13 +661,12 @@ class TestModelManagementServiceTDDCycle7:
                     update_result, bool
                 ), "update_model_version debe retornar bool"
 
-        except ImportError:
-            pytest.skip("ModelManagementService no disponible")
         except (AttributeError, AssertionError) as e:
             # RED PHASE: Se espera que falle
             pytest.fail(f"RED PHASE - Expected failure: {e}")
 
 
+@pytest.mark.xdist_group(name="modelmanagement")
 class TestModelManagementServiceFailureCases:
     """
     MEJORA 3: Tests de casos de fallo para ModelManagementService
@@ -694,183 +674,140 @@ class TestModelManagementServiceFailureCases:
 
     def test_model_management_invalid_model_registration(self):
         """Test registro de modelo inválido."""
-        try:
-            from app.services.model_management_service import ModelManagementService
-
-            service = ModelManagementService()
-
-            # Intentar registrar modelo inválido
-            invalid_cases = [
-                (None, "1.0.0"),  # Modelo nulo
-                ("", "1.0.0"),  # Nombre vacío
-                ("valid_model", ""),  # Versión vacía
-                ("valid_model", None),  # Versión nula
-            ]
-
-            for model_name, version in invalid_cases:
-                result = service.register_model(model_name, version)
-                assert (
-                    result is False
-                ), f"Registro inválido debería fallar: {model_name}, {version}"
-
-        except ImportError:
-            pytest.skip("ModelManagementService no disponible")
+        service = ModelManagementService()
+
+        # Intentar registrar modelo inválido
+        invalid_cases = [
+            (None, "1.0.0"),  # Modelo nulo
+            ("", "1.0.0"),  # Nombre vacío
+            ("valid_model", ""),  # Versión vacía
+            ("valid_model", None),  # Versión nula
+        ]
+
+        for model_name, version in invalid_cases:
+            result = service.register_model(model_name, version)
+            assert (
+                result is False
+            ), f"Registro inválido debería fallar: {model_name}, {version}"
 
     def test_model_management_concurrent_access_failure(self):
         """Test fallo en acceso concurrente a modelos."""
-        try:
-            import threading
-            import time
+        service = ModelManagementService()
+        errors = []
 
-            from app.services.model_management_service import ModelManagementService
+        def concurrent_access():
+            try:
+                # Simular acceso concurrente
+                service.get_model_version("concurrent_test")
+                time.sleep(0.01)  # Pequeña pausa
+                service.update_model_version("concurrent_test", "1.0.1")
+            except Exception as e:
+                errors.append(e)
 
-            service = ModelManagementService()
-            errors = []
-
-            def concurrent_access():
-                try:
-                    # Simular acceso concurrente
-                    service.get_model_version("concurrent_test")
-                    time.sleep(0.01)  # Pequeña pausa
-                    service.update_model_version("concurrent_test", "1.0.1")
-                except Exception as e:
-                    errors.append(e)
-
-            # Crear múltiples threads
-            threads = [threading.Thread(target=concurrent_access) for _ in range(5)]
-
-            for thread in threads:
-                thread.start()
-
-            for thread in threads:
-                thread.join()
-
-            # El servicio debe manejar acceso concurrente sin errores
-            # críticos
-            assert len(errors) == 0 or all(
-                isinstance(e, (AttributeError, KeyError)) for e in errors
-            )
+        # Crear múltiples threads
+        threads = [threading.Thread(target=concurrent_access) for _ in range(5)]
 
-        except ImportError:
-            pytest.skip("ModelManagementService no disponible")
+        for thread in threads:
+            thread.start()
 
-    def test_model_management_memory_limit_exceeded(self):
-        """Test comportamiento cuando se excede límite de memoria."""
-        try:
-            from app.services.model_management_service import ModelManagementService
+        for thread in threads:
+            thread.join()
 
-            service = ModelManagementService()
+        # El servicio debe manejar acceso concurrente sin errores
+        # críticos
+        assert len(errors) == 0 or all(
+            isinstance(e, (AttributeError, KeyError)) for e in errors
+        )
 
-            # Simular carga de muchos modelos (para probar límites)
-            large_model_data = {"data": "x" * 1000}  # Modelo "grande"
+    def test_model_management_memory_limit_exceeded(self):
+        """Test comportamiento cuando se excede límite de memoria."""
+        service = ModelManagementService()
 
-            # Intentar cargar múltiples modelos
-            for i in range(100):
-                model_name = f"large_model_{i}"
-                try:
-                    service.register_model(model_name, "1.0.0", large_model_data)
-                    # El servicio debe manejar límites de memoria
-                    # gracefully
-                except MemoryError:
-                    # Es aceptable que falle por memoria
-                    break
-                except Exception:
-                    # Otros errores son aceptables también
-                    pass
+        # Simular carga de muchos modelos (para probar límites)
+        large_model_data = {"data": "x" * 1000}  # Modelo "grande"
 
-            # El servicio debe seguir funcionando
-            assert hasattr(service, "model_registry")
+        # Intentar cargar múltiples modelos
+        for i in range(100):
+            model_name = f"large_model_{i}"
+            try:
+                service.register_model(model_name, "1.0.0", large_model_data)
+                # El servicio debe manejar límites de memoria
+                # gracefully
+            except MemoryError:
+                # Es aceptable que falle por memoria
+                break
+            except Exception:
+                # Otros errores son aceptables también
+                pass
 
-        except ImportError:
-            pytest.skip("ModelManagementService no disponible")
+        # El servicio debe seguir funcionando
+        assert hasattr(service, "model_registry")
 
 
+@pytest.mark.xdist_group(name="serviceinteraction")
 class TestServiceInteractionFailureCases:
     """
     MEJORA 5: Tests de interacción entre servicios y edge cases complejos
     """
 
     @pytest.mark.asyncio
-    async def test_prediction_service_model_management_interaction_failure(self):
+    async def test_prediction_service_model_management_interaction_failure(
+        self, monkeypatch, failing_mock
+    ):
         """Test fallo en interacción entre PredictionService y
         ModelManagementService."""
+        PredictionService()
+        model_service = ModelManagementService()
+
+        # Simular fallo en model management durante predicción
+        monkeypatch.setattr(
+            model_service,
+            "get_model_version",
+            failing_mock(Exception("Model service failed")),
+        )
+        # La predicción debe manejar el fallo
+        # gracefully
         try:
-            from app.services.model_management_service import ModelManagementService
-            from app.services.prediction_service import PredictionService
-
-            PredictionService()
-            model_service = ModelManagementService()
-
-            # Simular fallo en model management durante predicción
-            with patch.object(
-                model_service,
-                "get_model_version",
-                side_effect=Exception("Model service failed"),
-            ):
-                # La predicción debe manejar el fallo
-                # gracefully
-                try:
-                    # Intentar operación que requiere ambos servicios
-                    model_service.get_model_version("test_model")
-                except Exception as e:
-                    assert "Model service failed" in str(e)
-
-        except ImportError:
-            pytest.skip("Services no disponibles")
+            # Intentar operación que requiere ambos servicios
+            model_service.get_model_version("test_model")
+        except Exception as e:
+            assert "Model service failed" in str(e)
 
-    def test_service_chain_failure_propagation(self):
+    def test_service_chain_failure_propagation(self, monkeypatch, failing_mock):
         """Test propagación de fallos en cadena de servicios."""
-        try:
-            from app.services.hybrid_prediction_service import HybridPredictionService
-            from app.services.prediction_service import PredictionService
-
-            hybrid_service = HybridPredictionService()
-
-            # Simular fallo en cadena
-            with patch.object(
-                PredictionService, "__init__", side_effect=Exception("Chain failure")
-            ):
-                # El servicio híbrido debe manejar fallos en sus
-                # dependencias
-                # Como PredictionService está mockeado para fallar,
-                # cualquier operación que dependa de él fallará
-                # Verificamos que el servicio híbrido existe y puede
-                # manejar fallos de dependencias
-                assert hybrid_service is not None
-                assert hasattr(hybrid_service, "fallback_enabled")
-
-        except ImportError:
-            pytest.skip("HybridPredictionService no disponible")
-
-    def test_service_resource_exhaustion_scenario(self):
+        hybrid_service = HybridPredictionService()
+
+        # Simular fallo en cadena
+        monkeypatch.setattr(
+            PredictionService, "__init__", failing_mock(Exception("Chain failure"))
+        )
+        # El servicio híbrido debe manejar fallos en sus
+        # dependencias
+        # Como PredictionService está mockeado para fallar,
+        # cualquier operación que dependa de él fallará
+        # Verificamos que el servicio híbrido existe y puede
+        # manejar fallos de dependencias
+        assert hybrid_service is not None
+        assert hasattr(hybrid_service, "fallback_enabled")
+
+    def test_service_resource_exhaustion_scenario(self, monkeypatch, failing_mock):
         """Test comportamiento bajo agotamiento de recursos."""
+        service = PredictionService()
+
+        # Simular agotamiento de recursos (memoria, CPU, etc.)
+        monkeypatch.setattr(
+            service,
+            "_load_models",
+            failing_mock(MemoryError("Insufficient memory")),
+        )
+        # El servicio debe manejar agotamiento de recursos
         try:
-            from app.services.prediction_service import PredictionService
-
-            service = PredictionService()
-
-            # Simular agotamiento de recursos (memoria, CPU, etc.)
-            def resource_exhausted_operation():
-                raise MemoryError("Insufficient memory")
-
-            with patch.object(
-                service, "_load_models", side_effect=resource_exhausted_operation
-            ):
-                # El servicio debe manejar agotamiento de recursos
-                try:
-                    service._load_models()
-                except MemoryError:
-                    # Es aceptable que falle por recursos
-                    # El servicio debe seguir funcionando aunque haya fallado la carga
-                    assert hasattr(
-                        service, "is_ready"
-                    ), "Servicio debe tener estado is_ready"
-                    assert hasattr(
-                        service, "models"
-                    ), "Servicio debe tener atributo models"
-
-        except ImportError:
-            pytest.skip("PredictionService no disponible")
+            service._load_models()
+        except MemoryError:
+            # Es aceptable que falle por recursos
+            # El servicio debe seguir funcionando aunque haya fallado la carga
+            assert hasattr(service, "is_ready"), "Servicio debe tener estado is_ready"
+            assert hasattr(service, "models"), "Servicio debe tener atributo models"
 
 
 def test_tdd_cycle7_summary():
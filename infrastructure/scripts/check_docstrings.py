@@ -1,404 +1,959 @@
-#!/usr/bin/env python3
-"""
-📝 Verificador de Estándares de Docstrings - ML API FastAPI v2
-==============================================================
-
-Verifica que los docstrings en el código Python cumplan con:
-- PEP 257 (Docstring Conventions)
-- Google Style Guide
-- Numpy Style (opcional)
-- Sphinx compatibility
-
-Características:
-- Detecta funciones/clases sin docstrings
-- Verifica formato y estructura
-- Sugiere mejoras automáticas
-- Genera reportes detallados
-"""
-
-import ast
-import json
-import pathlib
-import sys
-from datetime import datetime
-from typing import Dict, List, Optional, Union
-from dataclasses import dataclass, asdict
-import re
-import argparse
-
-NodeWithDocstring = Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef]
-FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
-
-
-@dataclass
-class DocstringIssue:
-    """Representa un problema encontrado en un docstring"""
-
-    file_path: str
-    line_number: int
-    object_type: str  # 'function', 'class', 'method'
-    object_name: str
-    issue_type: str
-    severity: str  # 'error', 'warning', 'info'
-    description: str
-    suggestion: Optional[str] = None
-
-
-@dataclass
-class DocstringReport:
-    """Reporte completo de verificación de docstrings"""
-
-    timestamp: str
-    total_objects: int
-    objects_with_docstrings: int
-    total_issues: int
-    issues_by_severity: Dict[str, int]
-    issues: List[DocstringIssue]
-    compliance_score: float
-
-
-class DocstringChecker:
-    """Verificador principal de docstrings"""
-
-    def __init__(self, project_root: str = "."):
-        self.project_root = pathlib.Path(project_root)
-        self.backend_path = self.project_root / "backend"
-        self.issues = []
-        self.total_objects = 0
-        self.objects_with_docstrings = 0
-
-    def check_project(self) -> DocstringReport:
-        """Verificar docstrings en todo el proyecto"""
-        print("📝 Verificando estándares de docstrings...")
-
-        # Buscar archivos Python
-        python_files = []
-        if self.backend_path.exists():
-            python_files.extend(self.backend_path.rglob("*.py"))
-
-        # Agregar scripts de infraestructura
-        infra_path = self.project_root / "infrastructure" / "scripts"
-        if infra_path.exists():
-            python_files.extend(infra_path.rglob("*.py"))
-
-        # Filtrar archivos del venv y cache
-        python_files = [
-            f
-            for f in python_files
-            if "venv" not in str(f) and "__pycache__" not in str(f)
-        ]
-
-        print(f"  📁 Encontrados {len(python_files)} archivos Python")
-
-        for py_file in python_files:
-            self._check_file(py_file)
-
-        return self._generate_report()
-
-    def _check_file(self, file_path: pathlib.Path):
-        """Verificar docstrings en un archivo específico"""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            if not content.strip():
-                return  # Archivo vacío
-
-            tree = ast.parse(content)
-
-            for node in ast.walk(tree):
-                if isinstance(
-                    node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
-                ):
-                    self._check_node_docstring(node, file_path)
-
-        except SyntaxError as e:
-            self.issues.append(
-                DocstringIssue(
-                    file_path=str(file_path.relative_to(self.project_root)),
-                    line_number=getattr(e, "lineno", 1),
-                    object_type="file",
-                    object_name=file_path.name,
-                    issue_type="syntax_error",
-                    severity="error",
-                    description=f"Error de sintaxis: {e.msg}",
-                    suggestion="Corregir la sintaxis del archivo",
-                )
-            )
-        except Exception as e:
-            print(f"    ⚠️  Error procesando {file_path}: {e}")
-
-    def _check_node_docstring(self, node: NodeWithDocstring, file_path: pathlib.Path):
-        """Verificar docstring de un nodo específico (función/clase)"""
-        self.total_objects += 1
-
-        object_type = "class" if isinstance(node, ast.ClassDef) else "function"
-        object_name = node.name
-        line_number = node.lineno
-        file_rel_path = str(file_path.relative_to(self.project_root))
-
-        # Obtener docstring
-        docstring = ast.get_docstring(node)
-
-        if docstring is None:
-            # Verificar si es método privado/dunder (menos estricto)
-            if object_name.startswith("_"):
-                severity = "warning" if object_name.startswith("__") else "info"
-                issue_type = "missing_docstring_private"
-            else:
-                severity = "error"
-                issue_type = "missing_docstring"
-
-            suggestion = self._generate_docstring_suggestion(node, object_type)
-
-            self.issues.append(
-                DocstringIssue(
-                    file_path=file_rel_path,
-                    line_number=line_number,
-                    object_type=object_type,
-                    object_name=object_name,
-                    issue_type=issue_type,
-                    severity=severity,
-                    description=f"Falta docstring para {object_type} '{object_name}'",
-                    suggestion=suggestion,
-                )
-            )
-        else:
-            self.objects_with_docstrings += 1
-            # Verificar calidad del docstring
-            self._check_docstring_quality(
-                docstring, node, file_rel_path, object_type, object_name
-            )
-
-    def _check_docstring_quality(
-        self,
-        docstring: str,
-        node: NodeWithDocstring,
-        file_path: str,
-        object_type: str,
-        object_name: str,
-    ):
-        """Verificar calidad y formato del docstring"""
-        line_number = node.lineno
-        # 1. Verificar línea de resumen
-        lines = docstring.strip().split("\n")
-        if not lines or not lines[0].strip():
-            self.issues.append(
-                DocstringIssue(
-                    file_path=file_path,
-                    line_number=line_number,
-                    object_type=object_type,
-                    object_name=object_name,
-                    issue_type="empty_summary",
-                    severity="error",
-                    description="Docstring no tiene línea de resumen",
-                    suggestion="Agregar una línea de resumen descriptiva al inicio",
-                )
-            )
-
-        # 2. Verificar longitud de línea de resumen
-        elif len(lines[0]) > 88:
-            self.issues.append(
-                DocstringIssue(
-                    file_path=file_path,
-                    line_number=line_number,
-                    object_type=object_type,
-                    object_name=object_name,
-                    issue_type="summary_too_long",
-                    severity="warning",
-                    description=f"Línea de resumen excede los 88 caracteres ({len(lines[0])})",
-                    suggestion="Acortar la línea de resumen.",
-                )
-            )
-
-        # 3. Verificar si hay línea en blanco después del resumen
-        if len(lines) > 1 and lines[1].strip() != "":
-            self.issues.append(
-                DocstringIssue(
-                    file_path=file_path,
-                    line_number=line_number,
-                    object_type=object_type,
-                    object_name=object_name,
-                    issue_type="no_blank_line_after_summary",
-                    severity="warning",
-                    description="Falta una línea en blanco después del resumen del docstring.",
-                    suggestion="Añadir una línea en blanco.",
-                )
-            )
-
-        # 4. Verificaciones específicas para funciones
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            self._check_function_docstring(
-                docstring, node, file_path, line_number, object_name
-            )
-
-    def _check_function_docstring(
-        self,
-        docstring: str,
-        node: FunctionNode,
-        file_path: str,
-        line_number: int,
-        object_name: str,
-    ):
-        """Analizar las secciones específicas de un docstring de función."""
-        args_re = re.compile(r"Args:\s*\n")
-        returns_re = re.compile(r"Returns:\s*\n")
-
-        # Verificar sección de argumentos
-        if not args_re.search(docstring) and node.args.args:
-            self.issues.append(
-                DocstringIssue(
-                    file_path=file_path,
-                    line_number=line_number,
-                    object_type="function",
-                    object_name=object_name,
-                    issue_type="missing_args_section",
-                    severity="warning",
-                    description="Falta la sección 'Args' en el docstring.",
-                    suggestion="Añadir sección 'Args:' con descripción de parámetros.",
-                )
-            )
-
-        if not returns_re.search(docstring) and self._has_return_statement(node):
-            self.issues.append(
-                DocstringIssue(
-                    file_path=file_path,
-                    line_number=line_number,
-                    object_type="function",
-                    object_name=object_name,
-                    issue_type="missing_returns_section",
-                    severity="warning",
-                    description="La función tiene 'return' pero falta la sección 'Returns:'.",
-                    suggestion="Añadir sección 'Returns:' con descripción del valor de retorno.",
-                )
-            )
-
-    def _has_return_statement(self, node: FunctionNode) -> bool:
-        """Verifica si un nodo de función tiene una declaración de retorno explícita."""
-        return any(isinstance(child, ast.Return) for child in ast.walk(node))
-
-    def _generate_docstring_suggestion(
-        self, node: NodeWithDocstring, object_type: str
-    ) -> str:
-        """Genera una sugerencia de plantilla de docstring."""
-        if object_type == "function":
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                params = [
-                    arg.arg for arg in node.args.args if arg.arg not in ("self", "cls")
-                ]
-                has_return = self._has_return_statement(node)
-
-                suggestion = '"""One-line summary of the function.\\n\\n'
-                if params:
-                    suggestion += "Args:\\n"
-                    for param in params:
-                        suggestion += f"    {param} (type): Description of {param}.\\n"
-                if has_return:
-                    suggestion += (
-                        "\\nReturns:\\n    type: Description of return value.\\n"
-                    )
-                suggestion += '"""'
-                return suggestion
-        # class
-        return '"""Brief description of the class.\\n\\nAttributes:\\n    attr (type): Description.\\n"""'
-
-    def _generate_report(self) -> DocstringReport:
-        """Genera el reporte final de la verificación."""
-        issues_by_severity = {}
-        for issue in self.issues:
-            issues_by_severity[issue.severity] = (
-                issues_by_severity.get(issue.severity, 0) + 1
-            )
-
-        total_issues = len(self.issues)
-        if self.total_objects > 0:
-            compliance = (self.objects_with_docstrings / self.total_objects) * 100
-        else:
-            compliance = 100.0
-
-        return DocstringReport(
-            timestamp=datetime.utcnow().isoformat(),
-            total_objects=self.total_objects,
-            objects_with_docstrings=self.objects_with_docstrings,
-            total_issues=total_issues,
-            issues_by_severity=dict(issues_by_severity),
-            issues=self.issues,
-            compliance_score=compliance,
-        )
-
-    def generate_console_report(self, report: DocstringReport) -> str:
-        """Genera un reporte legible para la consola."""
-        report_lines = []
-        report_lines.append(f"📄 Reporte de Calidad de Docstrings ({report.timestamp})")
-        report_lines.append("=" * 60)
-        report_lines.append(
-            f"📊 Resumen: {report.total_objects} objetos analizados, "
-            f"{report.objects_with_docstrings} con docstrings."
-        )
-        report_lines.append(
-            f"🎯 Puntaje de Cumplimiento: {report.compliance_score:.2f}%"
-        )
-        report_lines.append(f"🚨 Total de Issues: {report.total_issues}")
-        for severity, count in report.issues_by_severity.items():
-            report_lines.append(f"  - {severity.capitalize()}: {count}")
-        report_lines.append("-" * 60)
-
-        if report.issues:
-            report_lines.append("🔍 Detalles de los Issues:")
-            sorted_issues = sorted(report.issues, key=lambda x: x.file_path)
-            for issue in sorted_issues:
-                report_lines.append(
-                    f"  - [{issue.severity.upper()}] {issue.file_path}:"
-                    f"{issue.line_number} ({issue.object_name}) - {issue.description}"
-                )
-        else:
-            report_lines.append("✅ ¡Excelente! No se encontraron issues.")
-
-        return "\\n".join(report_lines)
-
-    def generate_json_report(self, report: DocstringReport) -> str:
-        """Genera un reporte en formato JSON."""
-        return json.dumps(asdict(report), indent=4)
-
-
-def main():
-    """Punto de entrada principal para ejecutar el verificador."""
-    parser = argparse.ArgumentParser(
-        description="Verificador de Estándares de Docstrings para el proyecto."
-    )
-    parser.add_argument(
-        "--format",
-        choices=["console", "json"],
-        default="console",
-        help="Formato del reporte de salida.",
-    )
-    parser.add_argument(
-        "--output-file",
-        type=str,
-        default=None,
-        help="Archivo para guardar el reporte. Si no se especifica, se imprime en consola.",
-    )
-    args = parser.parse_args()
-
-    checker = DocstringChecker()
-    report = checker.check_project()
-
-    if args.format == "json":
-        output = checker.generate_json_report(report)
-    else:
-        output = checker.generate_console_report(report)
-
-    if args.output_file:
-        with open(args.output_file, "w", encoding="utf-8") as f:
-            f.write(output)
-        print(f"📄 Reporte guardado en {args.output_file}")
-    else:
-        print(output)
-
-    # Salir con código de error si hay issues de severidad 'error'
-    if any(issue.severity == "error" for issue in report.issues):
-        sys.exit(1)
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+📝 Verificador de Estándares de Docstrings - ML API FastAPI v2
+==============================================================
+
+Verifica que los docstrings en el código Python cumplan con:
+- PEP 257 (Docstring Conventions)
+- Google Style Guide
+- Numpy Style (opcional)
+- Sphinx compatibility
+
+Características:
+- Detecta funciones/clases sin docstrings
+- Verifica formato y estructura
+- Sugiere mejoras automáticas
+- Genera reportes detallados
+"""
+
+import ast
+import hashlib
+import io
+import json
+import os
+import pathlib
+import sqlite3
+import sys
+from collections import Counter, OrderedDict
+from itertools import repeat
+from operator import attrgetter
+from typing import Dict, List, Optional, TextIO, Tuple, Union
+from dataclasses import dataclass
+import re
+
+try:
+    import orjson  # Opcional: serialización JSON mucho más rápida
+except ImportError:
+    orjson = None
+
+try:
+    import pathspec  # Opcional: respetar .gitignore al recorrer el proyecto
+except ImportError:
+    pathspec = None
+
+NodeWithDocstring = Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef]
+FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+# Por debajo de este número de archivos no compensa arrancar procesos
+PARALLEL_MIN_FILES = 16
+
+# Tamaño de lectura tras agotar el tamaño conocido por stat() (archivo que crece)
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Vocabulario cerrado de los issues, internado para compartir las mismas cadenas
+SEV_ERROR = sys.intern("error")
+SEV_WARNING = sys.intern("warning")
+SEV_INFO = sys.intern("info")
+
+# Severidades en el orden en que se reportan
+SEVERITIES = (SEV_ERROR, SEV_WARNING, SEV_INFO)
+
+OBJ_FUNCTION = sys.intern("function")
+OBJ_CLASS = sys.intern("class")
+OBJ_FILE = sys.intern("file")
+
+ISSUE_SYNTAX_ERROR = sys.intern("syntax_error")
+ISSUE_MISSING_DOCSTRING = sys.intern("missing_docstring")
+ISSUE_MISSING_DOCSTRING_PRIVATE = sys.intern("missing_docstring_private")
+ISSUE_EMPTY_SUMMARY = sys.intern("empty_summary")
+ISSUE_SUMMARY_TOO_LONG = sys.intern("summary_too_long")
+ISSUE_NO_BLANK_LINE = sys.intern("no_blank_line_after_summary")
+ISSUE_MISSING_ARGS = sys.intern("missing_args_section")
+ISSUE_MISSING_RETURNS = sys.intern("missing_returns_section")
+
+# Secciones de docstring estilo Google
+_ARGS_SECTION_RE = re.compile(r"Args:\s*\n")
+_RETURNS_SECTION_RE = re.compile(r"Returns:\s*\n")
+
+# Campos que contienen sentencias; 'return', 'def' y 'class' solo viven ahí
+_STATEMENT_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+# Parámetros implícitos que no se documentan en 'Args:'
+_SKIP_PARAMS = frozenset({"self", "cls"})
+
+# Plantillas fijas de sugerencias (con saltos de línea escapados)
+_FUNCTION_SUGGESTION_HEAD = '"""One-line summary of the function.\\n\\n'
+_ARGS_SUGGESTION_HEAD = "Args:\\n"
+_PARAM_SUGGESTION = "    {0} (type): Description of {0}.\\n"
+_RETURNS_SUGGESTION = "\\nReturns:\\n    type: Description of return value.\\n"
+_CLASS_SUGGESTION = (
+    '"""Brief description of the class.\\n\\n'
+    'Attributes:\\n    attr (type): Description.\\n"""'
+)
+
+# Caché de resultados por archivo, relativa a project_root
+CACHE_FILE = ".docstring_cache.sqlite"
+
+# Incrementar al cambiar las reglas, el formato de los issues o el esquema de la
+# caché: invalida los resultados guardados
+CHECKER_VERSION = 2
+
+# Directorios que nunca se recorren
+EXCLUDED_DIRS = frozenset(
+    {
+        "venv",
+        ".venv",
+        "__pycache__",
+        "node_modules",
+        ".git",
+        ".tox",
+        "build",
+        "dist",
+        ".mypy_cache",
+        ".pytest_cache",
+    }
+)
+
+
+def _load_ignore_spec(project_root: pathlib.Path):
+    """Cargar el .gitignore del proyecto si pathspec está disponible."""
+    gitignore = project_root / ".gitignore"
+    if pathspec is None or not gitignore.is_file():
+        return None
+    with open(gitignore, "r", encoding="utf-8") as f:
+        return pathspec.GitIgnoreSpec.from_lines(f.read().splitlines())
+
+
+def _iter_py_files(
+    root: pathlib.Path,
+    excludes=EXCLUDED_DIRS,
+    ignore_spec=None,
+    base: Optional[pathlib.Path] = None,
+):
+    """Recorrer root con os.scandir y devolver rutas str de archivos .py.
+
+    Poda directorios excluidos y rutas ignoradas por .gitignore sin descender.
+    """
+    prefix = ""
+    if ignore_spec is not None and base is not None:
+        rel_root = root.relative_to(base).as_posix()
+        prefix = "" if rel_root == "." else rel_root + "/"
+
+    stack = [(str(root), prefix)]
+    while stack:
+        path, rel = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    entry_rel = rel + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in excludes or (
+                            ignore_spec is not None
+                            and ignore_spec.match_file(entry_rel + "/")
+                        ):
+                            continue
+                        stack.append((entry.path, entry_rel + "/"))
+                    elif entry.name.endswith(".py") and (
+                        ignore_spec is None or not ignore_spec.match_file(entry_rel)
+                    ):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+@dataclass(slots=True)
+class DocstringIssue:
+    """Representa un problema encontrado en un docstring"""
+
+    file_path: str
+    line_number: int
+    object_type: str  # 'function', 'class', 'method'
+    object_name: str
+    issue_type: str
+    severity: str  # 'error', 'warning', 'info'
+    description: str
+    suggestion: Optional[str] = None
+
+
+@dataclass(slots=True)
+class DocstringReport:
+    """Reporte completo de verificación de docstrings"""
+
+    timestamp: str
+    total_objects: int
+    objects_with_docstrings: int
+    total_issues: int
+    issues_by_severity: Dict[str, int]
+    issues: List[DocstringIssue]
+    compliance_score: float
+
+
+# Resultado por archivo: (issues, total de objetos, objetos con docstring)
+FileResult = Tuple[List[DocstringIssue], int, int]
+
+# Entrada de la caché de AST: ((mtime_ns, tamaño), árbol o None si no hay nada)
+_AstEntry = Tuple[Tuple[int, int], Optional[ast.AST]]
+
+
+class _DocstringVisitor(ast.NodeVisitor):
+    """Recorrido único del AST que detecta 'return' por función"""
+
+    def __init__(self, checker: "DocstringChecker", file_rel_path: str):
+        self.checker = checker
+        self.file_rel_path = file_rel_path
+        self.issues: List[DocstringIssue] = []
+        self.total_objects = 0
+        self.objects_with_docstrings = 0
+        self._return_stack: List[bool] = []
+
+    def _check(self, node: NodeWithDocstring, has_return: bool = False):
+        """Verificar un nodo acumulando issues y contadores del archivo"""
+        self.total_objects += 1
+        if self.checker._check_node_docstring(
+            node, self.file_rel_path, self.issues, has_return
+        ):
+            self.objects_with_docstrings += 1
+
+    def visit_FunctionDef(self, node: FunctionNode):
+        """Recorrer el cuerpo y luego verificar con el 'return' ya conocido"""
+        self._return_stack.append(False)
+        self.generic_visit(node)
+        self._check(node, self._return_stack.pop())
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        """Verificar la clase y descender a sus métodos"""
+        self._check(node)
+        self.generic_visit(node)
+
+    def generic_visit(self, node: ast.AST):
+        """Descender solo por listas de sentencias, sin entrar en expresiones"""
+        for field in _STATEMENT_FIELDS:
+            for child in getattr(node, field, ()):
+                self.visit(child)
+
+    def visit_Return(self, node: ast.Return):
+        """Marcar la función actual si retorna un valor"""
+        if node.value is not None and self._return_stack:
+            self._return_stack[-1] = True
+
+
+def _read_bytes(path: str, size: int) -> bytes:
+    """Leer un archivo con os.read usando el tamaño ya conocido por stat().
+
+    Reserva el buffer una sola vez con el tamaño exacto, en lugar del buffer
+    creciente de open().read(). O_BINARY evita la traducción CRLF en Windows.
+    size es solo una pista: se sigue leyendo hasta EOF, así un archivo que
+    creció desde el stat() no se analiza (ni se hashea) truncado.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        data = os.read(fd, size)
+        # Lecturas parciales (archivos grandes, señales) o archivo que creció
+        while True:
+            chunk = os.read(fd, max(size - len(data), _READ_CHUNK_SIZE))
+            if not chunk:
+                return data
+            data += chunk
+    finally:
+        os.close(fd)
+
+
+def _get_params(node: FunctionNode) -> Tuple[str, ...]:
+    """Parámetros posicionales a documentar (sin self/cls)."""
+    return tuple(a.arg for a in node.args.args if a.arg not in _SKIP_PARAMS)
+
+
+def _raw_docstring(node: NodeWithDocstring) -> Optional[str]:
+    """Docstring literal del nodo leyendo body[0] directamente (sin cleandoc)."""
+    body = node.body
+    if body and isinstance(body[0], ast.Expr):
+        value = body[0].value
+        if isinstance(value, ast.Constant) and isinstance(value.value, str):
+            return value.value
+    return None
+
+
+def _issue_to_dict(issue: DocstringIssue) -> dict:
+    """Convertir un issue a dict plano (sin la copia profunda de asdict)."""
+    return {
+        "file_path": issue.file_path,
+        "line_number": issue.line_number,
+        "object_type": issue.object_type,
+        "object_name": issue.object_name,
+        "issue_type": issue.issue_type,
+        "severity": issue.severity,
+        "description": issue.description,
+        "suggestion": issue.suggestion,
+    }
+
+
+def _report_to_dict(report: DocstringReport) -> dict:
+    """Convertir el reporte completo a dict listo para serializar."""
+    return {
+        "timestamp": report.timestamp,
+        "total_objects": report.total_objects,
+        "objects_with_docstrings": report.objects_with_docstrings,
+        "total_issues": report.total_issues,
+        "issues_by_severity": dict(report.issues_by_severity),
+        "issues": [_issue_to_dict(issue) for issue in report.issues],
+        "compliance_score": report.compliance_score,
+    }
+
+
+def _issue_to_tuple(issue: DocstringIssue) -> tuple:
+    """Convertir un issue a tupla en el orden de sus campos."""
+    return (
+        issue.file_path,
+        issue.line_number,
+        issue.object_type,
+        issue.object_name,
+        issue.issue_type,
+        issue.severity,
+        issue.description,
+        issue.suggestion,
+    )
+
+
+def _issue_from_dict(data: dict) -> DocstringIssue:
+    """Reconstruir un issue desde JSON reutilizando las cadenas internadas."""
+    for key in ("file_path", "object_type", "issue_type", "severity"):
+        data[key] = sys.intern(data[key])
+    return DocstringIssue(**data)
+
+
+class DocstringCache:
+    """Caché SQLite de resultados por archivo, indexada por (ruta, SHA-256).
+
+    Guarda además (mtime_ns, tamaño) de cada archivo: si no cambiaron, el
+    resultado se reutiliza sin leer ni hashear el contenido.
+    """
+
+    def __init__(self, db_path: pathlib.Path):
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # Resultados (o esquema) de otra versión del verificador no son reutilizables
+        (version,) = self.conn.execute("PRAGMA user_version").fetchone()
+        if version != CHECKER_VERSION:
+            with self.conn:
+                self.conn.execute("DROP TABLE IF EXISTS cache")
+                self.conn.execute(f"PRAGMA user_version = {CHECKER_VERSION}")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "path TEXT PRIMARY KEY, sha TEXT NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, "
+            "issues_json TEXT NOT NULL, "
+            "total_objects INTEGER NOT NULL, with_docstrings INTEGER NOT NULL)"
+        )
+
+    @staticmethod
+    def _row_to_result(row):
+        """Convertir una fila (issues_json, total, con_docstring) en resultado"""
+        if row is None:
+            return None
+        issues = [_issue_from_dict(data) for data in json.loads(row[0])]
+        return issues, row[1], row[2]
+
+    def get_by_stat(self, path: str, mtime_ns: int, size: int):
+        """Acierto rápido por (mtime_ns, tamaño), sin leer el archivo"""
+        row = self.conn.execute(
+            "SELECT issues_json, total_objects, with_docstrings FROM cache "
+            "WHERE path = ? AND mtime_ns = ? AND size = ?",
+            (path, mtime_ns, size),
+        ).fetchone()
+        return self._row_to_result(row)
+
+    def get(self, path: str, sha: str):
+        """Devolver (issues, total, con_docstring) o None si no hay acierto"""
+        row = self.conn.execute(
+            "SELECT issues_json, total_objects, with_docstrings FROM cache "
+            "WHERE path = ? AND sha = ?",
+            (path, sha),
+        ).fetchone()
+        return self._row_to_result(row)
+
+    def touch_many(self, entries):
+        """Actualizar (mtime_ns, tamaño) de archivos cuyo hash no cambió"""
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE cache SET mtime_ns = ?, size = ? WHERE path = ?",
+                [(mtime_ns, size, path) for path, mtime_ns, size in entries],
+            )
+
+    def put_many(self, entries):
+        """Guardar [(ruta, sha, mtime_ns, tamaño, (issues, total, con_docstring))]"""
+        rows = [
+            (
+                path,
+                sha,
+                mtime_ns,
+                size,
+                json.dumps([_issue_to_dict(i) for i in issues]),
+                total,
+                with_docs,
+            )
+            for path, sha, mtime_ns, size, (issues, total, with_docs) in entries
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def close(self):
+        """Cerrar la conexión"""
+        self.conn.close()
+
+
+class DocstringChecker:
+    """Verificador principal de docstrings"""
+
+    def __init__(
+        self, project_root: str = ".", use_cache: bool = True, ast_cache_size: int = 0
+    ):
+        self.project_root = pathlib.Path(project_root)
+        self.backend_path = self.project_root / "backend"
+        self.use_cache = use_cache
+        self.issues = []
+        self.total_objects = 0
+        self.objects_with_docstrings = 0
+        # Árboles ya parseados (LRU de ast_cache_size entradas, 0 = desactivada).
+        # Solo compensa en procesos de larga vida que reutilizan la instancia:
+        # en una ejecución única solo elevaría el pico de memoria.
+        self.ast_cache_size = ast_cache_size
+        self._ast_cache: "OrderedDict[str, _AstEntry]" = OrderedDict()
+
+    def clear_cache(self):
+        """Vaciar la caché en memoria de árboles AST"""
+        self._ast_cache.clear()
+
+    def check_project(self) -> DocstringReport:
+        """Verificar docstrings en todo el proyecto"""
+        print("📝 Verificando estándares de docstrings...")
+
+        # Buscar archivos Python (venv/cache y lo ignorado por git se podan)
+        ignore_spec = _load_ignore_spec(self.project_root)
+        python_files = []
+        if self.backend_path.exists():
+            python_files.extend(
+                _iter_py_files(
+                    self.backend_path, ignore_spec=ignore_spec, base=self.project_root
+                )
+            )
+
+        # Agregar scripts de infraestructura
+        infra_path = self.project_root / "infrastructure" / "scripts"
+        if infra_path.exists():
+            python_files.extend(
+                _iter_py_files(
+                    infra_path, ignore_spec=ignore_spec, base=self.project_root
+                )
+            )
+
+        print(f"  📁 Encontrados {len(python_files)} archivos Python")
+
+        results: List[Optional[FileResult]] = [None] * len(python_files)
+        pending = list(range(len(python_files)))
+        keys = {}
+
+        cache = self._open_cache()
+        if cache is not None:
+            pending, keys = self._lookup_cache(cache, python_files, results)
+            hits = len(python_files) - len(pending)
+            print(f"  ♻️  {hits} archivos sin cambios (caché)")
+
+        checked = self._run_checks([python_files[i] for i in pending])
+        for index, result in zip(pending, checked):
+            results[index] = result
+
+        if cache is not None:
+            # Los archivos que fallaron (None) no se guardan: se reintentan
+            try:
+                cache.put_many(
+                    (*keys[index], results[index])
+                    for index in pending
+                    if index in keys and results[index] is not None
+                )
+            except sqlite3.Error as e:
+                print(f"    ⚠️  No se pudo actualizar la caché: {e}")
+            finally:
+                cache.close()
+
+        for result in results:
+            if result is None:
+                continue  # Error ya informado al procesar el archivo
+            issues, total, with_docstrings = result
+            self.issues.extend(issues)
+            self.total_objects += total
+            self.objects_with_docstrings += with_docstrings
+
+        return self._generate_report()
+
+    def _lookup_cache(
+        self,
+        cache: DocstringCache,
+        python_files: List[str],
+        results: List[Optional[FileResult]],
+    ):
+        """Rellenar results con aciertos de caché; devolver (pendientes, claves).
+
+        Primero compara (mtime_ns, tamaño) con un solo stat(); solo si no
+        coincide lee y hashea el archivo. Un acierto por hash refresca el
+        stat guardado para que la siguiente ejecución tome el camino rápido.
+        """
+        pending = []
+        keys = {}
+        touched = []
+        for index, py_file in enumerate(python_files):
+            rel_path = os.path.relpath(py_file, self.project_root)
+            try:
+                st = os.stat(py_file)
+                stat_key = (st.st_mtime_ns, st.st_size)
+                cached = cache.get_by_stat(rel_path, *stat_key)
+                if cached is None:
+                    content = _read_bytes(py_file, st.st_size)
+                    digest = hashlib.sha256(content).hexdigest()
+                    cached = cache.get(rel_path, digest)
+                    if cached is not None:
+                        touched.append((rel_path, *stat_key))
+            except (OSError, sqlite3.Error):
+                pending.append(index)
+                continue
+            if cached is None:
+                pending.append(index)
+                keys[index] = (rel_path, digest, *stat_key)
+            else:
+                results[index] = cached
+
+        if touched:
+            try:
+                cache.touch_many(touched)
+            except sqlite3.Error as e:
+                print(f"    ⚠️  No se pudo actualizar la caché: {e}")
+        return pending, keys
+
+    def _open_cache(self) -> Optional[DocstringCache]:
+        """Abrir la caché persistente si está habilitada y disponible"""
+        if not self.use_cache:
+            return None
+        try:
+            return DocstringCache(self.project_root / CACHE_FILE)
+        except sqlite3.Error as e:
+            print(f"    ⚠️  Caché deshabilitada: {e}")
+            return None
+
+    def _run_checks(self, python_files: List[str]):
+        """Verificar archivos (en paralelo si son muchos) y devolver en orden"""
+        if len(python_files) < PARALLEL_MIN_FILES:
+            return [self._scan_file(f) for f in python_files]
+
+        # Import diferido: multiprocessing solo hace falta si hay pool
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return [
+                (
+                    None
+                    if result is None
+                    else ([DocstringIssue(*row) for row in result[0]], *result[1:])
+                )
+                for result in executor.map(
+                    _check_file_worker,
+                    python_files,
+                    repeat(self.project_root),
+                    chunksize=16,
+                )
+            ]
+
+    def _check_file(self, file_path: Union[str, os.PathLike]):
+        """Verificar docstrings en un archivo específico"""
+        result = self._scan_file(os.fspath(file_path))
+        if result is None:
+            return
+        issues, total, with_docstrings = result
+        self.issues.extend(issues)
+        self.total_objects += total
+        self.objects_with_docstrings += with_docstrings
+
+    def _scan_file(self, file_path: str) -> Optional[FileResult]:
+        """Analizar un archivo y devolver (issues, total, con_docstring).
+
+        None si falló por un error ajeno a su contenido (permisos, memoria,
+        decodificación): ese resultado no debe guardarse en la caché.
+        """
+        file_rel_path = os.path.relpath(file_path, self.project_root)
+        try:
+            tree = self._load_tree(file_path)
+            if tree is None:
+                return [], 0, 0
+
+            visitor = _DocstringVisitor(self, file_rel_path)
+            visitor.visit(tree)
+            return (
+                visitor.issues,
+                visitor.total_objects,
+                visitor.objects_with_docstrings,
+            )
+
+        except SyntaxError as e:
+            issue = DocstringIssue(
+                file_path=file_rel_path,
+                line_number=getattr(e, "lineno", 1),
+                object_type=OBJ_FILE,
+                object_name=os.path.basename(file_path),
+                issue_type=ISSUE_SYNTAX_ERROR,
+                severity=SEV_ERROR,
+                description=f"Error de sintaxis: {e.msg}",
+                suggestion="Corregir la sintaxis del archivo",
+            )
+            return [issue], 0, 0
+        except Exception as e:
+            print(f"    ⚠️  Error procesando {file_path}: {e}")
+            return None
+
+    def _load_tree(self, file_path: str) -> Optional[ast.AST]:
+        """Parsear un archivo reutilizando el AST si no cambió (None: nada que ver)"""
+        st = os.stat(file_path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._ast_cache.get(file_path)
+        if cached is not None and cached[0] == key:
+            self._ast_cache.move_to_end(file_path)
+            return cached[1]
+
+        # Bytes directos: el tokenizer respeta BOM y declaración de encoding
+        content = _read_bytes(file_path, st.st_size)
+
+        # Archivo vacío, o sin 'def ' ni 'class ': nada que verificar
+        if not content.strip() or (b"def " not in content and b"class " not in content):
+            tree = None
+        else:
+            # compile() directo con PyCF_ONLY_AST: sin el envoltorio de ast.parse
+            tree = compile(
+                content, file_path, "exec", ast.PyCF_ONLY_AST, dont_inherit=True
+            )
+
+        if self.ast_cache_size > 0:
+            self._ast_cache[file_path] = (key, tree)
+            self._ast_cache.move_to_end(file_path)
+            if len(self._ast_cache) > self.ast_cache_size:
+                self._ast_cache.popitem(last=False)
+        return tree
+
+    def _check_node_docstring(
+        self,
+        node: NodeWithDocstring,
+        file_rel_path: str,
+        issues: List[DocstringIssue],
+        has_return: bool = False,
+    ) -> bool:
+        """Verificar docstring de un nodo específico (función/clase)"""
+        object_type = OBJ_CLASS if isinstance(node, ast.ClassDef) else OBJ_FUNCTION
+        object_name = node.name
+        line_number = node.lineno
+
+        # Docstring crudo: los checks de calidad ya hacen strip
+        docstring = _raw_docstring(node)
+
+        if docstring is None:
+            # Verificar si es método privado/dunder (menos estricto)
+            if object_name.startswith("_"):
+                severity = SEV_WARNING if object_name.startswith("__") else SEV_INFO
+                issue_type = ISSUE_MISSING_DOCSTRING_PRIVATE
+            else:
+                severity = SEV_ERROR
+                issue_type = ISSUE_MISSING_DOCSTRING
+
+            suggestion = self._generate_docstring_suggestion(
+                node, object_type, has_return
+            )
+
+            issues.append(
+                DocstringIssue(
+                    file_path=file_rel_path,
+                    line_number=line_number,
+                    object_type=object_type,
+                    object_name=object_name,
+                    issue_type=issue_type,
+                    severity=severity,
+                    description=f"Falta docstring para {object_type} '{object_name}'",
+                    suggestion=suggestion,
+                )
+            )
+            return False
+
+        # Verificar calidad del docstring
+        self._check_docstring_quality(
+            docstring,
+            node,
+            file_rel_path,
+            object_type,
+            object_name,
+            issues,
+            has_return,
+        )
+        return True
+
+    def _check_docstring_quality(
+        self,
+        docstring: str,
+        node: NodeWithDocstring,
+        file_path: str,
+        object_type: str,
+        object_name: str,
+        issues: List[DocstringIssue],
+        has_return: bool = False,
+    ):
+        """Verificar calidad y formato del docstring"""
+        line_number = node.lineno
+        # 1. Verificar línea de resumen
+        stripped = docstring.strip()
+        first_nl = stripped.find("\n")
+        summary = stripped if first_nl == -1 else stripped[:first_nl]
+        if not stripped:
+            issues.append(
+                DocstringIssue(
+                    file_path=file_path,
+                    line_number=line_number,
+                    object_type=object_type,
+                    object_name=object_name,
+                    issue_type=ISSUE_EMPTY_SUMMARY,
+                    severity=SEV_ERROR,
+                    description="Docstring no tiene línea de resumen",
+                    suggestion="Agregar una línea de resumen descriptiva al inicio",
+                )
+            )
+
+        # 2. Verificar longitud de línea de resumen
+        elif len(summary) > 88:
+            issues.append(
+                DocstringIssue(
+                    file_path=file_path,
+                    line_number=line_number,
+                    object_type=object_type,
+                    object_name=object_name,
+                    issue_type=ISSUE_SUMMARY_TOO_LONG,
+                    severity=SEV_WARNING,
+                    description=f"Línea de resumen excede los 88 caracteres ({len(summary)})",
+                    suggestion="Acortar la línea de resumen.",
+                )
+            )
+
+        # 3. Verificar si hay línea en blanco después del resumen
+        if first_nl != -1:
+            second_nl = stripped.find("\n", first_nl + 1)
+            if second_nl == -1:
+                second_nl = len(stripped)
+        if first_nl != -1 and stripped[first_nl + 1 : second_nl].strip() != "":
+            issues.append(
+                DocstringIssue(
+                    file_path=file_path,
+                    line_number=line_number,
+                    object_type=object_type,
+                    object_name=object_name,
+                    issue_type=ISSUE_NO_BLANK_LINE,
+                    severity=SEV_WARNING,
+                    description="Falta una línea en blanco después del resumen del docstring.",
+                    suggestion="Añadir una línea en blanco.",
+                )
+            )
+
+        # 4. Verificaciones específicas para funciones
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            self._check_function_docstring(
+                docstring, node, file_path, line_number, object_name, issues, has_return
+            )
+
+    def _check_function_docstring(
+        self,
+        docstring: str,
+        node: FunctionNode,
+        file_path: str,
+        line_number: int,
+        object_name: str,
+        issues: List[DocstringIssue],
+        has_return: bool = False,
+    ):
+        """Analizar las secciones específicas de un docstring de función."""
+        # Verificar sección de argumentos
+        if node.args.args and not _ARGS_SECTION_RE.search(docstring):
+            issues.append(
+                DocstringIssue(
+                    file_path=file_path,
+                    line_number=line_number,
+                    object_type=OBJ_FUNCTION,
+                    object_name=object_name,
+                    issue_type=ISSUE_MISSING_ARGS,
+                    severity=SEV_WARNING,
+                    description="Falta la sección 'Args' en el docstring.",
+                    suggestion="Añadir sección 'Args:' con descripción de parámetros.",
+                )
+            )
+
+        if has_return and not _RETURNS_SECTION_RE.search(docstring):
+            issues.append(
+                DocstringIssue(
+                    file_path=file_path,
+                    line_number=line_number,
+                    object_type=OBJ_FUNCTION,
+                    object_name=object_name,
+                    issue_type=ISSUE_MISSING_RETURNS,
+                    severity=SEV_WARNING,
+                    description="La función tiene 'return' pero falta la sección 'Returns:'.",
+                    suggestion="Añadir sección 'Returns:' con descripción del valor de retorno.",
+                )
+            )
+
+    def _generate_docstring_suggestion(
+        self, node: NodeWithDocstring, object_type: str, has_return: bool = False
+    ) -> str:
+        """Genera una sugerencia de plantilla de docstring."""
+        if object_type == OBJ_FUNCTION:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                params = _get_params(node)
+
+                parts = [_FUNCTION_SUGGESTION_HEAD]
+                if params:
+                    parts.append(_ARGS_SUGGESTION_HEAD)
+                    parts.extend(_PARAM_SUGGESTION.format(param) for param in params)
+                if has_return:
+                    parts.append(_RETURNS_SUGGESTION)
+                parts.append('"""')
+                return "".join(parts)
+        # class
+        return _CLASS_SUGGESTION
+
+    def _generate_report(self) -> DocstringReport:
+        """Genera el reporte final de la verificación."""
+        from datetime import datetime
+
+        counts = Counter(issue.severity for issue in self.issues)
+        issues_by_severity = {severity: counts[severity] for severity in SEVERITIES}
+
+        total_issues = len(self.issues)
+        if self.total_objects > 0:
+            compliance = (self.objects_with_docstrings / self.total_objects) * 100
+        else:
+            compliance = 100.0
+
+        return DocstringReport(
+            timestamp=datetime.utcnow().isoformat(),
+            total_objects=self.total_objects,
+            objects_with_docstrings=self.objects_with_docstrings,
+            total_issues=total_issues,
+            issues_by_severity=issues_by_severity,
+            issues=self.issues,
+            compliance_score=compliance,
+        )
+
+    def generate_console_report(self, report: DocstringReport) -> str:
+        """Genera un reporte legible para la consola."""
+        buf = io.StringIO()
+        write = buf.write
+        write(f"📄 Reporte de Calidad de Docstrings ({report.timestamp})\n")
+        write("=" * 60 + "\n")
+        write(
+            f"📊 Resumen: {report.total_objects} objetos analizados, "
+            f"{report.objects_with_docstrings} con docstrings.\n"
+        )
+        write(f"🎯 Puntaje de Cumplimiento: {report.compliance_score:.2f}%\n")
+        write(f"🚨 Total de Issues: {report.total_issues}\n")
+        for severity, count in report.issues_by_severity.items():
+            write(f"  - {severity.capitalize()}: {count}\n")
+        write("-" * 60 + "\n")
+
+        if report.issues:
+            write("🔍 Detalles de los Issues:\n")
+            # Un solo sort por (archivo, línea); attrgetter evita un lambda por clave
+            sort_key = attrgetter("file_path", "line_number")
+            for issue in sorted(report.issues, key=sort_key):
+                write(
+                    f"  - [{issue.severity.upper()}] {issue.file_path}:"
+                    f"{issue.line_number} ({issue.object_name}) - "
+                    f"{issue.description}\n"
+                )
+        else:
+            write("✅ ¡Excelente! No se encontraron issues.\n")
+
+        return buf.getvalue()
+
+    def generate_json_report(
+        self, report: DocstringReport, fp: Optional[TextIO] = None
+    ) -> Optional[str]:
+        """Genera un reporte en formato JSON (o lo vuelca directo a fp)."""
+        if orjson is not None:
+            # orjson recorre los dataclasses (con slots) de forma nativa en C
+            output = orjson.dumps(report, option=orjson.OPT_INDENT_2).decode()
+        elif fp is not None:
+            json.dump(_report_to_dict(report), fp, indent=2, ensure_ascii=False)
+            return None
+        else:
+            output = json.dumps(_report_to_dict(report), indent=2, ensure_ascii=False)
+
+        if fp is not None:
+            fp.write(output)
+            return None
+        return output
+
+
+def _check_file_worker(file_path: str, project_root: pathlib.Path):
+    """Verificar un archivo en un proceso hijo del pool.
+
+    Los issues viajan como tuplas planas: se serializan bastante más rápido
+    que los dataclasses y el proceso padre los reconstruye.
+    """
+    checker = DocstringChecker(str(project_root), use_cache=False)
+    result = checker._scan_file(file_path)
+    if result is None:
+        return None
+    issues, total, with_docstrings = result
+    return [_issue_to_tuple(issue) for issue in issues], total, with_docstrings
+
+
+def main():
+    """Punto de entrada principal para ejecutar el verificador."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Verificador de Estándares de Docstrings para el proyecto."
+    )
+    parser.add_argument(
+        "--format",
+        choices=["console", "json"],
+        default="console",
+        help="Formato del reporte de salida.",
+    )
+    parser.add_argument(
+        "--output-file",
+        type=str,
+        default=None,
+        help="Archivo para guardar el reporte. Si no se especifica, se imprime en consola.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"No usar la caché de resultados ({CACHE_FILE}).",
+    )
+    args = parser.parse_args()
+
+    checker = DocstringChecker(use_cache=not args.no_cache)
+    report = checker.check_project()
+
+    if args.output_file:
+        with open(args.output_file, "w", encoding="utf-8") as f:
+            if args.format == "json":
+                checker.generate_json_report(report, fp=f)
+            else:
+                f.write(checker.generate_console_report(report))
+        print(f"📄 Reporte guardado en {args.output_file}")
+    elif args.format == "json":
+        print(checker.generate_json_report(report))
+    else:
+        print(checker.generate_console_report(report))
+
+    # Salir con código de error si hay issues de severidad 'error'
+    if report.issues_by_severity[SEV_ERROR]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,18 +17,81 @@ Características:
 - Reportes detallados
 """
 
+import hashlib
+import io
 import json
+import os
 import pathlib
 import re
+import sqlite3
 import subprocess
 import sys
 from datetime import datetime
-from dataclasses import asdict, dataclass
-from typing import Dict, List, Optional
-from collections import Counter
-
-
-@dataclass
+from functools import lru_cache
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, NamedTuple, Optional, TextIO, Tuple, cast
+from collections import Counter, OrderedDict
+from itertools import repeat
+
+try:
+    import ijson  # Opcional: parseo incremental de la salida de markdownlint
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Opcional: serialización JSON mucho más rápida
+except ImportError:
+    orjson = None
+
+# Errores de salida JSON inválida: ijson.JSONError no hereda de ValueError
+_JSON_ERRORS = (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
+
+# Por debajo de este número de archivos no compensa arrancar procesos
+# (el análisis de un .md cuesta ~1 ms; arrancar el pool, decenas de ms)
+PARALLEL_MIN_FILES = 64
+
+# Directorios que nunca se recorren
+EXCLUDED_DIRS = frozenset(
+    {
+        "venv",
+        ".venv",
+        "__pycache__",
+        "node_modules",
+        ".git",
+        ".tox",
+        "build",
+        "dist",
+        ".mypy_cache",
+        ".pytest_cache",
+    }
+)
+
+# Invocación única de markdownlint: el CLI expande el glob desde project_root
+# y omite los mismos directorios que el recorrido en Python
+MARKDOWNLINT_CMD = (
+    "markdownlint",
+    "--json",
+    "--dot",
+    *(arg for name in sorted(EXCLUDED_DIRS) for arg in ("--ignore", f"**/{name}/**")),
+    "**/*.md",
+)
+
+# Patrones compartidos por todos los archivos (compilados una sola vez).
+# Las líneas se analizan como bytes; solo las que pueden contener un enlace
+# a .md se decodifican para aplicar _LINK_RE.
+_ORDERED_LIST_RE = re.compile(rb"^\d+\.\s")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+\.md(?:#[\w-]+)?)\)")
+_LIST_PREFIXES = (b"- ", b"* ", b"+ ")
+
+# Caché de resultados por archivo, relativa a project_root
+CACHE_FILE = ".markdown_cache.sqlite"
+
+# Incrementar al cambiar las reglas, el formato de los issues o el esquema de la
+# caché: invalida los resultados guardados
+CHECKER_VERSION = 2
+
+
+@dataclass(slots=True)
 class MarkdownIssue:
     """Representa un problema encontrado en un archivo Markdown."""
 
@@ -40,7 +103,7 @@ class MarkdownIssue:
     suggestion: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MarkdownReport:
     """Reporte completo de verificación de Markdown."""
 
@@ -54,14 +117,186 @@ class MarkdownReport:
     compliance_score: float
 
 
+# Enlaces internos encontrados en un archivo: (línea, destino sin ancla)
+Links = List[Tuple[int, str]]
+
+# Resultado de contenido por archivo: (issues, enlaces internos)
+FileResult = Tuple[List[MarkdownIssue], Links]
+
+
+class _LoadedFile(NamedTuple):
+    """Contenido de un archivo leído una sola vez y compartido entre checks"""
+
+    lines: List[bytes]
+    stripped: List[bytes]
+    has_links: bool  # False si el archivo no contiene ".md" en ninguna parte
+
+
+def _issue_to_dict(issue: MarkdownIssue) -> dict:
+    """Convertir un issue a dict plano (sin la copia profunda de asdict)."""
+    return {
+        "file_path": issue.file_path,
+        "line_number": issue.line_number,
+        "rule_id": issue.rule_id,
+        "severity": issue.severity,
+        "description": issue.description,
+        "suggestion": issue.suggestion,
+    }
+
+
+def _iter_md_files(root: pathlib.Path, excludes=EXCLUDED_DIRS):
+    """Recorrer root con os.scandir y devolver rutas str de archivos .md.
+
+    Poda los directorios excluidos sin descender en ellos y conserva el orden
+    de rglob (primero en profundidad, entradas en el orden de scandir). Con
+    root "." las rutas salen sin prefijo "./", igual que con pathlib.
+    """
+    top = str(root)
+    stack = ["" if top == os.curdir else top]
+    while stack:
+        path = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(path or os.curdir) as entries:
+                for entry in entries:
+                    child = entry.path if path else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in excludes:
+                            subdirs.append(child)
+                    elif entry.name.endswith(".md"):
+                        yield child
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def _first_significant_byte(stream: io.BufferedReader) -> bytes:
+    """Saltar el espacio en blanco inicial de stream y mirar el byte siguiente.
+
+    peek() solo ve lo que ya está en el buffer, que puede ser únicamente
+    espacio en blanco: se descarta y se vuelve a mirar hasta encontrar un
+    byte significativo. Devuelve b"" si la salida termina antes.
+    """
+    while True:
+        buffered = stream.peek(1)
+        if not buffered:
+            return b""
+        stripped = buffered.lstrip()
+        # read() de lo ya inspeccionado se sirve del buffer, sin bloquear
+        stream.read(len(buffered) - len(stripped))
+        if stripped:
+            return stripped[:1]
+
+
+@lru_cache(maxsize=8192)
+def _path_exists(path: str) -> bool:
+    """os.path.exists memoizado: un mismo destino se enlaza desde muchos archivos."""
+    return os.path.exists(path)
+
+
+class MarkdownCache:
+    """Caché SQLite del análisis de estructura, indexada por (ruta, BLAKE2b).
+
+    Guarda los issues que dependen solo del contenido y los enlaces internos
+    encontrados; la existencia de los destinos se comprueba en cada ejecución.
+    Si (mtime_ns, tamaño) no cambió, el archivo ni se lee ni se hashea.
+    """
+
+    def __init__(self, db_path: pathlib.Path):
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # Resultados (o esquema) de otra versión del verificador no son reutilizables
+        (version,) = self.conn.execute("PRAGMA user_version").fetchone()
+        if version != CHECKER_VERSION:
+            with self.conn:
+                self.conn.execute("DROP TABLE IF EXISTS cache")
+                self.conn.execute(f"PRAGMA user_version = {CHECKER_VERSION}")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "path TEXT PRIMARY KEY, digest TEXT NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, "
+            "issues_json TEXT NOT NULL, links_json TEXT NOT NULL)"
+        )
+
+    @staticmethod
+    def _row_to_result(row):
+        """Convertir una fila (issues_json, links_json) en (issues, enlaces)"""
+        if row is None:
+            return None
+        issues = [MarkdownIssue(**data) for data in json.loads(row[0])]
+        links = [(line, target) for line, target in json.loads(row[1])]
+        return issues, links
+
+    def get_by_stat(self, path: str, mtime_ns: int, size: int):
+        """Acierto rápido por (mtime_ns, tamaño), sin leer el archivo"""
+        row = self.conn.execute(
+            "SELECT issues_json, links_json FROM cache "
+            "WHERE path = ? AND mtime_ns = ? AND size = ?",
+            (path, mtime_ns, size),
+        ).fetchone()
+        return self._row_to_result(row)
+
+    def get(self, path: str, digest: str):
+        """Devolver (issues, enlaces) o None si no hay acierto"""
+        row = self.conn.execute(
+            "SELECT issues_json, links_json FROM cache WHERE path = ? AND digest = ?",
+            (path, digest),
+        ).fetchone()
+        return self._row_to_result(row)
+
+    def touch_many(self, entries):
+        """Actualizar (mtime_ns, tamaño) de archivos cuyo hash no cambió"""
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE cache SET mtime_ns = ?, size = ? WHERE path = ?",
+                [(mtime_ns, size, path) for path, mtime_ns, size in entries],
+            )
+
+    def put_many(self, entries):
+        """Guardar [(ruta, hash, mtime_ns, tamaño, (issues, enlaces))]"""
+        rows = [
+            (
+                path,
+                digest,
+                mtime_ns,
+                size,
+                json.dumps([_issue_to_dict(i) for i in issues]),
+                json.dumps(links),
+            )
+            for path, digest, mtime_ns, size, (issues, links) in entries
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def close(self):
+        """Cerrar la conexión"""
+        self.conn.close()
+
+
 class MarkdownChecker:
     """Verificador principal de estándares Markdown."""
 
-    def __init__(self, project_root: str = "."):
+    def __init__(
+        self, project_root: str = ".", use_cache: bool = True, file_cache_size: int = 0
+    ):
         self.project_root = pathlib.Path(project_root)
+        self.use_cache = use_cache
+        # Prefijo a recortar para obtener rutas relativas a project_root ("" si
+        # es "."): las rutas se derivan de project_root tal cual se recibió
+        root = str(self.project_root)
+        self._root_prefix = "" if root == "." else os.path.join(root, "")
         self.issues = []
         self.total_files = 0
         self.files_with_issues = 0
+        # Archivos ya leídos (LRU de file_cache_size entradas, 0 = desactivada).
+        # Solo compensa si la instancia se reutiliza en un proceso de larga vida:
+        # en una ejecución única mantendría todos los archivos en memoria.
+        self.file_cache_size = file_cache_size
+        self._file_cache: "OrderedDict[str, Tuple[Tuple[int, int], _LoadedFile]]" = (
+            OrderedDict()
+        )
 
         # Reglas y sus descripciones
         self.rule_descriptions = {
@@ -118,13 +353,8 @@ class MarkdownChecker:
         """Verificar archivos Markdown en todo el proyecto."""
         print("📄 Verificando estándares de Markdown...")
 
-        # Buscar archivos Markdown
-        md_files = list(self.project_root.rglob("*.md"))
-
-        # Filtrar archivos del venv y node_modules
-        md_files = [
-            f for f in md_files if "venv" not in str(f) and "node_modules" not in str(f)
-        ]
+        # Buscar archivos Markdown (venv, node_modules, etc. se podan al recorrer)
+        md_files = list(_iter_md_files(self.project_root))
 
         self.total_files = len(md_files)
         print(f"  📁 Encontrados {self.total_files} archivos Markdown")
@@ -132,66 +362,196 @@ class MarkdownChecker:
         if self.total_files == 0:
             return self._generate_report()
 
-        # Ejecutar markdownlint
-        self._run_markdownlint(md_files)
-
-        # Verificaciones adicionales
-        for md_file in md_files:
-            self._check_file_structure(md_file)
+        try:
+            # Ejecutar markdownlint (una sola invocación con glob)
+            self._run_markdownlint()
+
+            # Verificaciones adicionales; los destinos de los enlaces se
+            # comprueban siempre, porque dependen de otros archivos
+            results = self._collect_results(md_files)
+            for md_file, (issues, links) in zip(md_files, results):
+                self.issues.extend(issues)
+                self._check_internal_links(links, md_file, self.issues)
+        finally:
+            # No arrastrar resultados de existencia a ejecuciones posteriores
+            _path_exists.cache_clear()
 
         return self._generate_report()
 
-    def _run_markdownlint(self, md_files: List[pathlib.Path]):
-        """Ejecutar markdownlint en los archivos."""
-        try:
-            # Preparar comando
-            cmd = ["markdownlint", "--json"] + [str(f) for f in md_files]
+    def _collect_results(self, md_files: List[str]):
+        """Analizar contenido de los archivos, reutilizando la caché si se puede"""
+        results: List[Optional[FileResult]] = [None] * len(md_files)
+        pending = list(range(len(md_files)))
+        keys = {}
 
-            # Ejecutar markdownlint
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, cwd=self.project_root
-            )
+        cache = self._open_cache()
+        try:
+            if cache is not None:
+                pending, keys = self._lookup_cache(cache, md_files, results)
+                hits = len(md_files) - len(pending)
+                print(f"  ♻️  {hits} archivos sin cambios (caché)")
 
-            if result.returncode == 0:
-                print("  ✅ No se encontraron issues con markdownlint")
-                return
+            checked = self._run_checks([md_files[i] for i in pending])
+            for index, result in zip(pending, checked):
+                results[index] = result
 
-            # Parsear salida JSON si está disponible
-            if result.stdout:
+            if cache is not None:
+                # La caché nunca debe hacer fallar la ejecución
                 try:
-                    lint_results = json.loads(result.stdout)
-                    self._parse_markdownlint_results(lint_results)
-                except json.JSONDecodeError:
-                    # Fallback: parsear salida de texto
-                    self._parse_markdownlint_text(result.stdout)
+                    cache.put_many(
+                        (*keys[index], results[index])
+                        for index in pending
+                        if index in keys
+                    )
+                except sqlite3.Error as e:
+                    print(f"    ⚠️  No se pudo actualizar la caché: {e}")
+        finally:
+            if cache is not None:
+                cache.close()
+        return results
+
+    def _lookup_cache(
+        self,
+        cache: MarkdownCache,
+        md_files: List[str],
+        results: List[Optional[FileResult]],
+    ):
+        """Rellenar results con aciertos de caché; devolver (pendientes, claves).
+
+        Primero compara (mtime_ns, tamaño) con un solo stat(); solo si no
+        coincide lee y hashea el archivo. Un acierto por hash refresca el
+        stat guardado para que la siguiente ejecución tome el camino rápido.
+        """
+        pending = []
+        keys = {}
+        touched = []
+        for index, md_file in enumerate(md_files):
+            rel_path = self._rel(md_file)
+            try:
+                st = os.stat(md_file)
+                stat_key = (st.st_mtime_ns, st.st_size)
+                cached = cache.get_by_stat(rel_path, *stat_key)
+                if cached is None:
+                    with open(md_file, "rb") as f:
+                        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+                    cached = cache.get(rel_path, digest)
+                    if cached is not None:
+                        touched.append((rel_path, *stat_key))
+            except (OSError, sqlite3.Error):
+                pending.append(index)
+                continue
+            if cached is None:
+                pending.append(index)
+                keys[index] = (rel_path, digest, *stat_key)
             else:
-                # Parsear stderr como texto
-                self._parse_markdownlint_text(result.stderr)
+                results[index] = cached
+
+        if touched:
+            try:
+                cache.touch_many(touched)
+            except sqlite3.Error as e:
+                print(f"    ⚠️  No se pudo actualizar la caché: {e}")
+        return pending, keys
+
+    def _open_cache(self) -> Optional[MarkdownCache]:
+        """Abrir la caché persistente si está habilitada y disponible"""
+        if not self.use_cache:
+            return None
+        try:
+            return MarkdownCache(self.project_root / CACHE_FILE)
+        except sqlite3.Error as e:
+            print(f"    ⚠️  Caché deshabilitada: {e}")
+            return None
+
+    def _run_checks(
+        self, md_files: List[str]
+    ) -> List[Tuple[List[MarkdownIssue], Links]]:
+        """Analizar el contenido de los archivos y devolver (issues, enlaces)."""
+        if len(md_files) < PARALLEL_MIN_FILES:
+            return [self._scan_content(f) for f in md_files]
+
+        # Import diferido: multiprocessing solo hace falta si hay pool
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return [
+                ([MarkdownIssue(*row) for row in rows], links)
+                for rows, links in executor.map(
+                    _check_file_worker,
+                    md_files,
+                    repeat(str(self.project_root)),
+                    chunksize=16,
+                )
+            ]
+
+    def _run_markdownlint(self):
+        """Ejecutar markdownlint sobre todo el proyecto.
+
+        Se pasa un glob en lugar de la lista de archivos: un solo arranque de
+        Node.js y una línea de comandos de tamaño fijo, sin importar cuántos
+        archivos haya. La salida se consume del pipe a medida que llega.
+        """
+        try:
+            # markdownlint escribe los resultados en stderr: se unen a stdout
+            # para leerlos de un único pipe
+            proc = subprocess.Popen(
+                list(MARKDOWNLINT_CMD),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                cwd=self.project_root,
+            )
+            with proc:
+                if proc.stdout is None:
+                    raise RuntimeError("no se pudo abrir la salida de markdownlint")
+                # Con el buffer por defecto, Popen entrega un BufferedReader
+                stdout = cast(io.BufferedReader, proc.stdout)
+                head = _first_significant_byte(stdout)
+                if head == b"[":
+                    try:
+                        if ijson is not None:
+                            # Registro a registro: memoria constante
+                            records = ijson.items(stdout, "item")
+                        else:
+                            records = json.load(stdout)
+                        self._parse_markdownlint_results(records)
+                    except _JSON_ERRORS as e:
+                        print(f"  ⚠️  Salida JSON de markdownlint inválida: {e}")
+                elif head:
+                    # Fallback: parsear salida de texto
+                    output = stdout.read().decode("utf-8", "replace")
+                    self._parse_markdownlint_text(output)
+
+            if proc.returncode == 0:
+                print("  ✅ No se encontraron issues con markdownlint")
 
         except FileNotFoundError:
             print("  ⚠️  markdownlint no está instalado. Instalando...")
             try:
+                # La salida de npm no se usa: solo se conserva stderr para errores
                 subprocess.run(
                     ["npm", "install", "-g", "markdownlint-cli"],
                     check=True,
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                 )
                 print("  ✅ markdownlint instalado. Reintentando...")
-                self._run_markdownlint(md_files)
+                self._run_markdownlint()
             except subprocess.CalledProcessError:
                 print("  ❌ No se pudo instalar markdownlint")
         except Exception as e:
             print(f"  ⚠️  Error ejecutando markdownlint: {e}")
 
-    def _parse_markdownlint_results(self, results: List[Dict]):
-        """Parsear resultados JSON de markdownlint."""
+    def _parse_markdownlint_results(self, results: Iterable[Dict]):
+        """Parsear resultados JSON de markdownlint (lista o flujo de registros)."""
         files_with_issues = set()
 
         for file_result in results:
-            file_path = file_result.get("fileName", "")
-            rel_path = str(pathlib.Path(file_path).relative_to(self.project_root))
+            # Con cwd=project_root el CLI ya reporta rutas relativas a la raíz
+            rel_path = file_result.get("fileName", "")
 
-            for issue in file_result.get("issues", []):
+            # markdownlint-cli emite un registro plano por issue; se acepta
+            # también el formato agrupado por archivo ({"fileName", "issues"})
+            for issue in file_result.get("issues", (file_result,)):
                 files_with_issues.add(rel_path)
 
                 rule_names = issue.get("ruleNames", [])
@@ -227,7 +587,7 @@ class MarkdownChecker:
             if len(parts) < 3:
                 continue
 
-            file_path = parts[0]
+            rel_path = parts[0]
             try:
                 line_number = int(parts[1])
             except ValueError:
@@ -239,11 +599,6 @@ class MarkdownChecker:
             rule_id = rule_parts[0] if rule_parts else "Unknown"
             description = rule_parts[1] if len(rule_parts) > 1 else rule_desc
 
-            try:
-                rel_path = str(pathlib.Path(file_path).relative_to(self.project_root))
-            except ValueError:
-                rel_path = file_path
-
             files_with_issues.add(rel_path)
 
             self.issues.append(
@@ -274,17 +629,72 @@ class MarkdownChecker:
         }
         return suggestions.get(rule_id)
 
+    def _rel(self, path) -> str:
+        """Ruta relativa a project_root recortando el prefijo (sin pathlib)."""
+        path_str = str(path)
+        prefix = self._root_prefix
+        return path_str[len(prefix) :] if path_str.startswith(prefix) else path_str
+
     def _check_file_structure(self, file_path: pathlib.Path):
         """Verificar estructura adicional del archivo."""
+        self.issues.extend(self._scan_file(file_path))
+
+    def _scan_file(self, file_path) -> List[MarkdownIssue]:
+        """Analizar la estructura de un archivo y devolver sus issues."""
+        issues, links = self._scan_content(file_path)
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+            self._check_internal_links(links, str(file_path), issues)
+        finally:
+            _path_exists.cache_clear()
+        return issues
+
+    def clear_cache(self):
+        """Vaciar la caché en memoria de archivos leídos"""
+        self._file_cache.clear()
+
+    def _load_file(self, file_path: pathlib.Path) -> _LoadedFile:
+        """Leer un archivo reutilizando el resultado si no cambió.
+
+        Las líneas se recortan una sola vez, en lugar de repetir strip() en
+        cada check. Se trabaja sobre bytes: todos los checks son prefijos
+        ASCII, así que no hace falta decodificar cada línea.
+        """
+        path_str = str(file_path)
+        st = os.stat(path_str)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._file_cache.get(path_str)
+        if cached is not None and cached[0] == key:
+            self._file_cache.move_to_end(path_str)
+            return cached[1]
+
+        with open(path_str, "rb") as f:
+            data = f.read()
+        # Validar UTF-8 solo si hay bytes no ASCII (isascii no reserva memoria)
+        if not data.isascii():
+            data.decode("utf-8")
+        lines = data.splitlines()
+        loaded = _LoadedFile(lines, [line.strip() for line in lines], b".md" in data)
+
+        if self.file_cache_size > 0:
+            self._file_cache[path_str] = (key, loaded)
+            self._file_cache.move_to_end(path_str)
+            if len(self._file_cache) > self.file_cache_size:
+                self._file_cache.popitem(last=False)
+        return loaded
+
+    def _scan_content(self, file_path) -> Tuple[List[MarkdownIssue], Links]:
+        """Issues que dependen solo del contenido, más los enlaces internos."""
+        file_path = pathlib.Path(file_path)
+        issues = []
+        links = []
+        try:
+            lines, stripped, has_links = self._load_file(file_path)
 
             # Verificar título principal
-            if not lines or not lines[0].startswith("# "):
-                self.issues.append(
+            if not lines or not lines[0].startswith(b"# "):
+                issues.append(
                     MarkdownIssue(
-                        file_path=str(file_path.relative_to(self.project_root)),
+                        file_path=self._rel(file_path),
                         line_number=1,
                         rule_id="structure-title",
                         severity="warning",
@@ -293,100 +703,121 @@ class MarkdownChecker:
                     )
                 )
 
-            # Verificar consistencia en subtítulos (usar ## y no ### para nivel 2)
-            for i, line in enumerate(lines, 1):
-                if line.strip().startswith("### "):
-                    self.issues.append(
-                        MarkdownIssue(
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=i,
-                            rule_id="structure-subtitle",
-                            severity="info",
-                            description="Se encontró un subtítulo de nivel 3 (###). ¿Debería ser nivel 2 (##)?",
-                            suggestion="Considera usar '##' para subtítulos principales.",
-                        )
-                    )
-
-            # Verificar saltos de línea antes de listas
-            self._check_whitespace_around_lists(lines, file_path)
-
-            # Verificar enlaces internos
-            self._check_internal_links(
-                [line.strip() for line in lines], str(file_path), file_path
-            )
+            # Subtítulos, listas y enlaces en una sola pasada
+            links = self._scan_lines(stripped, file_path, issues, has_links)
 
         except Exception as e:
-            self.issues.append(
+            issues.append(
                 MarkdownIssue(
-                    file_path=str(file_path.relative_to(self.project_root)),
+                    file_path=self._rel(file_path),
                     line_number=1,
                     rule_id="file-read-error",
                     severity="error",
                     description=f"Error al procesar estructura: {e}",
                 )
             )
-
-    def _check_whitespace_around_lists(self, lines: List[str], file_path: pathlib.Path):
-        """Verifica que las listas estén rodeadas por líneas en blanco."""
+        return issues, links
+
+    def _scan_lines(
+        self,
+        lines: List[bytes],
+        file_path: pathlib.Path,
+        issues: List[MarkdownIssue],
+        has_links: bool = True,
+    ) -> Links:
+        """Recorrer las líneas (ya recortadas) una sola vez.
+
+        En la misma pasada detecta subtítulos de nivel 3, listas sin línea en
+        blanco alrededor y enlaces internos. Los issues se agregan agrupados
+        por regla, en el mismo orden que antes de fusionar los recorridos.
+        """
+        rel_path = self._rel(file_path)
+        subtitle_issues = []
+        list_issues = []
+        links = []
         in_list = False
-        try:
-            for i, line in enumerate(lines):
-                is_list_item = line.strip().startswith(("- ", "* ", "+ ")) or re.match(
-                    r"^\d+\.\s", line.strip()
+        for i, line in enumerate(lines):
+            # Consistencia en subtítulos (usar ## y no ### para nivel 2)
+            if line.startswith(b"### "):
+                subtitle_issues.append(
+                    MarkdownIssue(
+                        file_path=rel_path,
+                        line_number=i + 1,
+                        rule_id="structure-subtitle",
+                        severity="info",
+                        description="Se encontró un subtítulo de nivel 3 (###). ¿Debería ser nivel 2 (##)?",
+                        suggestion="Considera usar '##' para subtítulos principales.",
+                    )
                 )
-                if is_list_item and not in_list:
-                    # Comienzo de una lista
-                    if i > 0 and lines[i - 1].strip() != "":
-                        self.issues.append(
-                            MarkdownIssue(
-                                file_path=str(file_path),
-                                line_number=i,
-                                rule_id="CUSTOM-W001",
-                                severity="warning",
-                                description="La lista no está precedida por una línea en blanco.",
-                                suggestion="Añadir línea en blanco antes de la lista.",
-                            )
+
+            # Listas rodeadas por líneas en blanco
+            is_list_item = (
+                line.startswith(_LIST_PREFIXES)
+                or _ORDERED_LIST_RE.match(line) is not None
+            )
+            if is_list_item and not in_list:
+                # Comienzo de una lista
+                if i > 0 and lines[i - 1]:
+                    list_issues.append(
+                        MarkdownIssue(
+                            file_path=rel_path,
+                            line_number=i,
+                            rule_id="CUSTOM-W001",
+                            severity="warning",
+                            description="La lista no está precedida por una línea en blanco.",
+                            suggestion="Añadir línea en blanco antes de la lista.",
                         )
-                elif not is_list_item and in_list:
-                    # Fin de una lista
-                    if lines[i].strip() != "":
-                        self.issues.append(
-                            MarkdownIssue(
-                                file_path=str(file_path),
-                                line_number=i,
-                                rule_id="CUSTOM-W002",
-                                severity="warning",
-                                description="La lista no está seguida de una línea en blanco.",
-                                suggestion="Añadir línea en blanco después de la lista.",
-                            )
+                    )
+            elif not is_list_item and in_list:
+                # Fin de una lista
+                if line:
+                    list_issues.append(
+                        MarkdownIssue(
+                            file_path=rel_path,
+                            line_number=i,
+                            rule_id="CUSTOM-W002",
+                            severity="warning",
+                            description="La lista no está seguida de una línea en blanco.",
+                            suggestion="Añadir línea en blanco después de la lista.",
                         )
-                in_list = is_list_item
-        except Exception as e:
-            print(f"  ⚠️  Error en _check_whitespace_around_lists: {e}")
+                    )
+            in_list = is_list_item
+
+            # Enlaces internos (su destino se verifica aparte)
+            if has_links and b".md" in line:
+                for match in _LINK_RE.finditer(line.decode("utf-8")):
+                    links.append((i + 1, match.group(2).split("#")[0]))
+
+        issues.extend(subtitle_issues)
+        issues.extend(list_issues)
+        return links
 
     def _check_internal_links(
-        self, lines: List[str], file_path: str, current_file: pathlib.Path
+        self, links: Links, file_path: str, issues: List[MarkdownIssue]
     ):
         """Verifica que los enlaces internos a archivos .md sean válidos."""
-        link_regex = re.compile(r"\[([^\]]+)\]\(([^)]+\.md(?:#[\w-]+)?)\)")
-        for i, line in enumerate(lines):
-            for match in link_regex.finditer(line):
-                link_target = match.group(2).split("#")[0]
-                target_path = (
-                    current_file.parent / pathlib.Path(link_target)
-                ).resolve()
-
-                if not target_path.exists():
-                    self.issues.append(
-                        MarkdownIssue(
-                            file_path=file_path,
-                            line_number=i + 1,
-                            rule_id="CUSTOM-L001",
-                            severity="error",
-                            description=f"Enlace interno roto a '{link_target}'.",
-                            suggestion=f"Verifica la ruta del enlace en la línea {i + 1}.",
-                        )
+        rel_path = self._rel(file_path)
+        current_dir = os.path.dirname(file_path)
+        for line_number, link_target in links:
+            target_path = os.path.join(current_dir, link_target)
+            if ".." in target_path:
+                # normpath colapsaría "symlink/.." sin seguir el enlace
+                target_path = str(pathlib.Path(target_path).resolve())
+            else:
+                # exists() ya sigue los symlinks en el kernel: basta la ruta léxica
+                target_path = os.path.normpath(target_path)
+
+            if not _path_exists(target_path):
+                issues.append(
+                    MarkdownIssue(
+                        file_path=rel_path,
+                        line_number=line_number,
+                        rule_id="CUSTOM-L001",
+                        severity="error",
+                        description=f"Enlace interno roto a '{link_target}'.",
+                        suggestion=f"Verifica la ruta del enlace en la línea {line_number}.",
                     )
+                )
 
     def _generate_report(self) -> MarkdownReport:
         """Genera el reporte final."""
@@ -452,9 +883,10 @@ class MarkdownChecker:
 
         return "\n".join(report_lines)
 
-    def generate_json_report(self, report: MarkdownReport) -> str:
-        """Genera un reporte en formato JSON."""
-        # El reporte ya contiene los issues como diccionarios
+    def generate_json_report(
+        self, report: MarkdownReport, fp: Optional[TextIO] = None
+    ) -> Optional[str]:
+        """Genera un reporte en formato JSON (o lo vuelca directo a fp)."""
         report_dict = {
             "timestamp": report.timestamp,
             "summary": {
@@ -465,9 +897,43 @@ class MarkdownChecker:
                 "issues_by_severity": report.issues_by_severity,
                 "issues_by_rule": report.issues_by_rule,
             },
-            "issues": [asdict(issue) for issue in report.issues],
+            "issues": [_issue_to_dict(issue) for issue in report.issues],
         }
-        return json.dumps(report_dict, indent=4)
+        if orjson is not None:
+            output = orjson.dumps(report_dict, option=orjson.OPT_INDENT_2).decode()
+        elif fp is not None:
+            json.dump(report_dict, fp, indent=2, ensure_ascii=False)
+            return None
+        else:
+            output = json.dumps(report_dict, indent=2, ensure_ascii=False)
+
+        if fp is not None:
+            fp.write(output)
+            return None
+        return output
+
+
+def _issue_to_tuple(issue: MarkdownIssue) -> tuple:
+    """Convertir un issue a tupla en el orden de sus campos."""
+    return (
+        issue.file_path,
+        issue.line_number,
+        issue.rule_id,
+        issue.severity,
+        issue.description,
+        issue.suggestion,
+    )
+
+
+def _check_file_worker(file_path: str, project_root: str) -> Tuple[List[tuple], Links]:
+    """Analizar un archivo en un proceso hijo del pool.
+
+    Los issues viajan como tuplas planas: se serializan bastante más rápido
+    que los dataclasses y el proceso padre los reconstruye.
+    """
+    checker = MarkdownChecker(project_root, use_cache=False)
+    issues, links = checker._scan_content(file_path)
+    return [_issue_to_tuple(issue) for issue in issues], links
 
 
 def main():
@@ -489,22 +955,27 @@ def main():
         default=None,
         help="Archivo para guardar el reporte. Si no se especifica, se imprime en consola.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"No usar la caché de resultados ({CACHE_FILE}).",
+    )
     args = parser.parse_args()
 
-    checker = MarkdownChecker()
+    checker = MarkdownChecker(use_cache=not args.no_cache)
     report = checker.check_project()
 
-    if args.format == "json":
-        output = checker.generate_json_report(report)
-    else:
-        output = checker.generate_console_report(report)
-
     if args.output_file:
         with open(args.output_file, "w", encoding="utf-8") as f:
-            f.write(output)
+            if args.format == "json":
+                checker.generate_json_report(report, fp=f)
+            else:
+                f.write(checker.generate_console_report(report))
         print(f"📄 Reporte guardado en {args.output_file}")
+    elif args.format == "json":
+        print(checker.generate_json_report(report))
     else:
-        print(output)
+        print(checker.generate_console_report(report))
 
     # Salir con código de error si hay issues de severidad 'error'
     if any(issue.severity == "error" for issue in report.issues):